@@ -0,0 +1,53 @@
+"""Per-update cost of BarAggregator's 1s/1m/5m bars, from stream trades one at a
+time and from polled snapshots a batch at a time.
+
+    uv run --extra numpy python -m benchmarks.bench_bars
+"""
+
+import time
+
+import numpy as np
+
+from tradierpy.bars import BarAggregator
+
+SYMBOLS = [f"SYM{i}" for i in range(500)]
+TRADES = 100_000
+POLLS = 1000
+START = 1727447400000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    bars = BarAggregator(symbols=len(SYMBOLS))
+    symbols = rng.choice(SYMBOLS, TRADES).tolist()
+    # 10 trades a millisecond, so plenty of 1s bars roll over
+    times = (START + np.arange(TRADES) // 10).tolist()
+    prices = (100 + rng.standard_normal(TRADES).cumsum() / 100).tolist()
+    start = time.perf_counter()
+    for symbol, t, price in zip(symbols, times, prices):
+        bars.update(symbol, t, price, 100)
+    elapsed = time.perf_counter() - start
+    print(f"{'stream trades':<16} {elapsed / TRADES * 1e6:6.2f} µs/trade")
+
+    bars = BarAggregator(symbols=len(SYMBOLS))
+    columns = {
+        "symbol": np.array(SYMBOLS),
+        "last": np.full(len(SYMBOLS), 100.0),
+        "volume": np.zeros(len(SYMBOLS), dtype=np.int64),
+        "trade_date": np.full(len(SYMBOLS), START, dtype=np.int64),
+    }
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        columns["volume"] = columns["volume"] + 100
+        columns["trade_date"] = columns["trade_date"] + 250
+        bars.add_columns(columns)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'snapshots':<16} {elapsed / (POLLS * len(SYMBOLS)) * 1e6:6.2f} µs/quote  "
+        f"({elapsed / POLLS * 1000:.2f} ms per {len(SYMBOLS)} symbol poll)"
+    )
+    print(f"{'memory':<16} {bars.nbytes / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
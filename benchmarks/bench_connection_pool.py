@@ -0,0 +1,65 @@
+"""Per-call latency of get_quotes with a pooled client vs a new AsyncClient per call.
+
+    uv run python -m benchmarks.bench_connection_pool
+
+The stand-in server is plain HTTP on localhost, so this only measures the TCP connect
+and client setup saved by reuse. Against api.tradier.com the TLS handshake and real
+round trips make the gap considerably larger.
+"""
+
+import asyncio
+import statistics
+import time
+
+from httpx import AsyncClient
+
+from benchmarks.mock_server import MockTradierServer
+from benchmarks.payloads import quotes_payload
+from tradierpy.client import TradierClient
+
+CALLS = 500
+SYMBOLS = ["AAPL", "MSFT", "SPY"]
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples_ms = sorted(s * 1000 for s in samples)
+    print(
+        f"{name:<20} mean {statistics.fmean(samples_ms):7.3f} ms  "
+        f"p50 {samples_ms[len(samples_ms) // 2]:7.3f} ms  "
+        f"p99 {samples_ms[int(len(samples_ms) * 0.99)]:7.3f} ms"
+    )
+
+
+async def main() -> None:
+    async with MockTradierServer(
+        lambda method, path, params, form: quotes_payload(form["symbols"].split(","))
+    ) as server:
+        async with TradierClient("bench", "bench", base_url=server.url) as tradier:
+            # Without reuse: what every TradierClient method used to do.
+            samples = []
+            for _ in range(CALLS):
+                start = time.perf_counter()
+                async with AsyncClient() as client:
+                    res = await client.post(
+                        f"{server.url}/markets/quotes",
+                        data={"symbols": ",".join(SYMBOLS)},
+                    )
+                    tradier.try_parse_quotes_response(res)
+                samples.append(time.perf_counter() - start)
+            connections = server.connections
+            report("new client per call", samples)
+
+            samples = []
+            for _ in range(CALLS):
+                start = time.perf_counter()
+                await tradier.get_quotes(*SYMBOLS)
+                samples.append(time.perf_counter() - start)
+            report("pooled client", samples)
+            print(
+                f"connections opened: {connections} without reuse, "
+                f"{server.connections - connections} pooled"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
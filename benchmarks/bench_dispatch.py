@@ -0,0 +1,64 @@
+"""Per-response cost of validating against Union[errors..., T] vs dispatching on the
+top-level keys to exactly one validator.
+
+    uv run python -m benchmarks.bench_dispatch
+"""
+
+import json
+import timeit
+from typing import Union
+
+from httpx import Response
+from pydantic import TypeAdapter
+
+from benchmarks.payloads import (
+    option_quotes_payload,
+    option_symbols,
+    orders,
+    orders_payload,
+    quotes_payload,
+)
+from tradierpy.client import JsonErrorResponse, TradierClient
+from tradierpy.order import GetOrdersResponse
+from tradierpy.quote import GetQuotesResponse
+
+PAYLOADS = {
+    "1 stock quote": (GetQuotesResponse, quotes_payload(["SPY"])),
+    "100 option quotes": (
+        GetQuotesResponse,
+        option_quotes_payload(option_symbols("SPY", 100)),
+    ),
+    "1 order": (GetOrdersResponse, orders_payload(orders(1))),
+    "100 orders": (GetOrdersResponse, orders_payload(orders(100))),
+}
+
+
+def union_parser(model):
+    """What validate_json_response did before dispatching."""
+    ta = TypeAdapter(Union[JsonErrorResponse, model])
+    return lambda res: ta.validate_python(res.json())
+
+
+def main() -> None:
+    for name, (model, payload) in PAYLOADS.items():
+        content = json.dumps(payload).encode()
+        parsers = {
+            "union": union_parser(model),
+            "dispatch": TradierClient.validate_json_response(model),
+            "dispatch, fast": TradierClient.validate_json_response(model, fast=True),
+        }
+        print(name)
+        for mode, parse in parsers.items():
+            number = 20_000 // len(content) + 10
+            best = min(
+                timeit.repeat(
+                    lambda: parse(Response(200, content=content)),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            print(f"  {mode:<16} {best / number * 1e6:10.1f} µs/response")
+
+
+if __name__ == "__main__":
+    main()
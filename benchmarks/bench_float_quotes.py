@@ -0,0 +1,42 @@
+"""Parsing option quotes into Decimal vs float quote models.
+
+uv run python -m benchmarks.bench_float_quotes
+"""
+
+import json
+import timeit
+
+from httpx import Response
+
+from benchmarks.payloads import option_quotes_payload, option_symbols
+from tradierpy.client import TradierClient
+from tradierpy.float_quote import FloatGetQuotesResponse
+from tradierpy.quote import GetQuotesResponse
+
+COUNTS = (100, 5_000)
+
+
+def main() -> None:
+    for count in COUNTS:
+        content = json.dumps(
+            option_quotes_payload(option_symbols("SPY", count))
+        ).encode()
+        print(f"{count:,} option quotes")
+        for fast in (False, True):
+            for model in (GetQuotesResponse, FloatGetQuotesResponse):
+                parse = TradierClient.validate_json_response(model, fast=fast)
+                number = max(1, 500 // count)
+                best = min(
+                    timeit.repeat(
+                        lambda: parse(Response(200, content=content)),
+                        number=number,
+                        repeat=5,
+                    )
+                )
+                label = f"{'float' if model is FloatGetQuotesResponse else 'Decimal'}"
+                label += ", fast" if fast else ""
+                print(f"  {label:<16} {best / number * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Throughput of concurrent get_quotes fan-out over HTTP/1.1 pooling vs HTTP/2.
+
+    uv run --extra http2 python -m benchmarks.bench_http2
+
+Each stand-in server adds a fixed simulated latency per request, so throughput is
+bounded by how many requests can be in flight at once: the HTTP/1.1 pool by its
+connection limit, HTTP/2 by the server's max concurrent streams on one connection.
+"""
+
+import asyncio
+import time
+
+from benchmarks.mock_server import MockTradierH2Server, MockTradierServer
+from benchmarks.payloads import quotes_payload
+from tradierpy.client import TradierClient
+
+LATENCY = 0.02
+CONCURRENCY = 100
+ROUNDS = 5
+
+
+def handler(method, path, params, form):
+    return quotes_payload(form["symbols"].split(","))
+
+
+async def fan_out(tradier: TradierClient) -> float:
+    await tradier.get_quotes("SPY")  # warm up the connection(s)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(
+            *(tradier.get_quotes("AAPL", "MSFT") for _ in range(CONCURRENCY))
+        )
+    return CONCURRENCY * ROUNDS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    async with MockTradierServer(handler, latency=LATENCY) as server:
+        async with TradierClient("bench", "bench", base_url=server.url) as tradier:
+            rps = await fan_out(tradier)
+        print(f"HTTP/1.1 pooled  {rps:8.1f} req/s over {server.connections} conns")
+
+    async with MockTradierH2Server(handler, latency=LATENCY) as server:
+        async with TradierClient(
+            "bench", "bench", base_url=server.url, http2=True
+        ) as tradier:
+            rps = await fan_out(tradier)
+        print(f"HTTP/2           {rps:8.1f} req/s over {server.connections} conns")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
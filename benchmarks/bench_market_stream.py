@@ -0,0 +1,53 @@
+"""Quote updates per second from the market events stream vs polling get_quotes as
+fast as possible, for the same symbols.
+
+    uv run --extra stream python -m benchmarks.bench_market_stream
+"""
+
+import asyncio
+import time
+
+from benchmarks.mock_server import MockTradierServer
+from benchmarks.mock_stream_server import MockMarketStreamServer
+from benchmarks.payloads import quotes_payload, stream_session
+from tradierpy.client import TradierClient
+from tradierpy.market_stream import MarketStream
+
+SYMBOLS = [f"SYM{i}" for i in range(50)]
+MESSAGES = 2000
+POLLS = 200
+
+
+def handler(method: str, path: str, params: dict[str, str], form: dict[str, str]):
+    if path == "/markets/events/session":
+        return stream_session("unused")
+    return quotes_payload(form["symbols"].split(","))
+
+
+async def main() -> None:
+    async with (
+        MockTradierServer(handler) as server,
+        MockMarketStreamServer(messages=MESSAGES) as stream_server,
+    ):
+        async with TradierClient("bench", "bench", base_url=server.url) as tradier:
+            start = time.perf_counter()
+            for _ in range(POLLS):
+                await tradier.get_quotes(*SYMBOLS)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{'polling get_quotes':<20} {POLLS * len(SYMBOLS) / elapsed:10,.0f} "
+                f"quotes/s  {POLLS} requests"
+            )
+
+            start = time.perf_counter()
+            async with MarketStream(tradier, SYMBOLS, url=stream_server.url) as stream:
+                events = sum([1 async for _ in stream])
+            elapsed = time.perf_counter() - start
+            print(
+                f"{'market stream':<20} {events / elapsed:10,.0f} quotes/s  "
+                f"{elapsed / events * 1e6:.1f} µs/event"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
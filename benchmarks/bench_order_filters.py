@@ -0,0 +1,56 @@
+"""Polling for open orders: downloading the whole history and filtering locally vs
+letting Tradier filter with get_orders(status=...).
+
+    uv run python -m benchmarks.bench_order_filters
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from benchmarks.mock_server import MockTradierServer
+from benchmarks.payloads import orders, orders_payload
+from tradierpy.client import TradierClient, order_filters
+from tradierpy.order import OrderStatus
+
+HISTORY = orders(5000, open_every=50)
+CALLS = 20
+OPEN = [OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED, OrderStatus.PENDING]
+
+
+def handler(method: str, path: str, params: dict[str, str], form: dict[str, str]):
+    statuses = params["status"].split(",") if "status" in params else None
+    return orders_payload(
+        [
+            order
+            for order in HISTORY
+            if (statuses is None or order["status"] in statuses)
+            and params.get("symbol", order["symbol"]) == order["symbol"]
+            and params.get("class", order["class"]) == order["class"]
+        ]
+    )
+
+
+async def main() -> None:
+    since = datetime(2024, 1, 1)
+    async with MockTradierServer(handler) as server:
+        async with TradierClient("bench", "bench", base_url=server.url) as tradier:
+            for name, status in (
+                ("all, filter locally", None),
+                ("status filter", OPEN),
+            ):
+                payload = json.dumps(handler("GET", "", order_filters(status), {}))
+                start = time.perf_counter()
+                for _ in range(CALLS):
+                    response = await tradier.get_orders(since, status=status)
+                    open_orders = [o for o in response.orders if o.status in OPEN]
+                elapsed = (time.perf_counter() - start) / CALLS
+                print(
+                    f"{name:<20} {len(open_orders):4} open orders  "
+                    f"{len(payload) / 1024:8.1f} KiB  {elapsed * 1000:8.2f} ms/call"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
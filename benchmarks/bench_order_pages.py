@@ -0,0 +1,67 @@
+"""Fetching a long order history: get_orders (sequential 10,000-order pages, all held
+at once) vs iter_orders split into date windows fetched concurrently.
+
+    uv run python -m benchmarks.bench_order_pages
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks.mock_server import MockTradierServer
+from benchmarks.payloads import orders, orders_payload
+from tradierpy.client import TradierClient
+
+DAYS = 250
+ORDERS = 25_000
+LATENCY = 0.1
+FIRST_DAY = date(2024, 1, 1)
+
+# Spread evenly over DAYS, oldest first
+HISTORY = [
+    (FIRST_DAY + timedelta(days=i * DAYS // ORDERS), order)
+    for i, order in enumerate(orders(ORDERS))
+]
+
+
+def handler(method: str, path: str, params: dict[str, str], form: dict[str, str]):
+    start = date.fromisoformat(params["start"])
+    end = date.fromisoformat(params["end"]) if "end" in params else date.max
+    page, limit = int(params["page"]), int(params["limit"])
+    matched = [order for day, order in HISTORY if start <= day <= end]
+    return orders_payload(matched[(page - 1) * limit : page * limit])
+
+
+async def main() -> None:
+    since = datetime.combine(FIRST_DAY, datetime.min.time())
+    until = since + timedelta(days=DAYS)
+    async with MockTradierServer(handler, latency=LATENCY) as server:
+        async with TradierClient("bench", "bench", base_url=server.url) as tradier:
+            start = time.perf_counter()
+            requests = server.requests
+            count = len((await tradier.get_orders(since)).orders)
+            print(
+                f"{'get_orders':<32} {count} orders  "
+                f"{server.requests - requests:3} requests  "
+                f"{time.perf_counter() - start:6.3f} s  "
+                f"peak {count} orders held"
+            )
+
+            for window in (None, timedelta(days=30), timedelta(days=7)):
+                start = time.perf_counter()
+                requests = server.requests
+                count = peak = 0
+                async for page in tradier.iter_orders(since, until, window=window):
+                    count += len(page.orders)
+                    peak = max(peak, len(page.orders))
+                name = f"iter_orders, {window.days if window else 'no'} day windows"
+                print(
+                    f"{name:<32} {count} orders  "
+                    f"{server.requests - requests:3} requests  "
+                    f"{time.perf_counter() - start:6.3f} s  "
+                    f"peak {peak} orders per page"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
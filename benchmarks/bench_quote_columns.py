@@ -0,0 +1,46 @@
+"""Mid prices over option quotes: looping over models vs NumPy columns.
+
+uv run --extra numpy python -m benchmarks.bench_quote_columns
+"""
+
+import json
+import timeit
+
+from httpx import Response
+
+from benchmarks.payloads import option_quotes_payload, option_symbols
+from tradierpy.client import TradierClient
+from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_columns import quote_columns, quote_columns_from_json
+
+COUNT = 5_000
+
+
+def main() -> None:
+    content = json.dumps(option_quotes_payload(option_symbols("SPY", COUNT))).encode()
+    parse = TradierClient.validate_json_response(GetQuotesResponse, fast=True)
+
+    def models():
+        quotes = parse(Response(200, content=content)).quotes
+        return [(q.bid + q.ask) / 2 for q in quotes]
+
+    def models_to_columns():
+        columns = quote_columns(parse(Response(200, content=content)))
+        return (columns["bid"] + columns["ask"]) / 2
+
+    def raw_to_columns():
+        columns = quote_columns_from_json(content)
+        return (columns["bid"] + columns["ask"]) / 2
+
+    print(f"mids of {COUNT:,} option quotes")
+    for name, f in (
+        ("models, python loop", models),
+        ("models -> columns", models_to_columns),
+        ("raw json -> columns", raw_to_columns),
+    ):
+        best = min(timeit.repeat(f, number=1, repeat=5))
+        print(f"  {name:<22} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Publishing quotes to a QuoteHub with fast, slow and filtered subscribers: publish
+cost, and how slow ones stay bounded by conflating (or dropping, with fewer slots
+than symbols).
+
+    uv run python -m benchmarks.bench_quote_hub
+"""
+
+import asyncio
+import time
+
+from benchmarks.payloads import quotes_payload
+from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_hub import QuoteHub, QuoteSubscription
+
+SYMBOLS = [f"SYM{i}" for i in range(500)]
+POLLS = 400
+
+
+async def consume(subscription: QuoteSubscription, delay: float) -> None:
+    async for _ in subscription:
+        if delay:
+            # Stands in for real work, which lets the publisher get ahead
+            await asyncio.sleep(delay)
+
+
+async def main() -> None:
+    response = GetQuotesResponse.model_validate(quotes_payload(SYMBOLS))
+    hub = QuoteHub()
+    consumers = [
+        asyncio.create_task(consume(hub.subscribe(name="fast"), 0)),
+        asyncio.create_task(consume(hub.subscribe(name="slow"), 0.001)),
+        asyncio.create_task(
+            consume(hub.subscribe(maxsize=100, name="slow, 100"), 0.001)
+        ),
+        asyncio.create_task(consume(hub.subscribe(SYMBOLS[:10], name="filtered"), 0)),
+    ]
+
+    publishing = 0.0
+    for _ in range(POLLS):
+        start = time.perf_counter()
+        hub.publish_response(response)
+        publishing += time.perf_counter() - start
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.1)
+
+    quotes = POLLS * len(SYMBOLS)
+    print(f"published {quotes} quotes, {publishing / quotes * 1e6:.2f} µs/quote")
+    for name, stats in hub.stats().items():
+        print(
+            f"  {name:<10} delivered {stats.delivered:7}  "
+            f"conflated {stats.conflated:7}  dropped {stats.dropped:7}  "
+            f"pending {stats.pending:4}"
+        )
+    hub.close()
+    await asyncio.gather(*consumers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""Import time of tradierpy.client, TradierClient construction time, and the one-off
+cost of the first response parse (when the deferred schemas get built).
+
+    uv run python -m benchmarks.bench_startup
+
+Each measurement runs in a fresh interpreter. pydantic and httpx are imported before
+the clock starts, so only tradierpy's own import cost is counted.
+"""
+
+import subprocess
+import sys
+
+RUNS = 7
+
+SNIPPET = """
+import json, time
+import httpx, pydantic, pydantic.fields, pydantic.main
+from benchmarks.payloads import orders, orders_payload
+
+start = time.perf_counter()
+from tradierpy.client import TradierClient
+imported = time.perf_counter()
+tradier = TradierClient("bench", "bench")
+constructed = time.perf_counter()
+for _ in range(100):
+    TradierClient("bench", "bench")
+reconstructed = time.perf_counter()
+tradier.try_parse_orders_response(
+    httpx.Response(200, json=orders_payload(orders(3)))
+)
+parsed = time.perf_counter()
+print(
+    imported - start,
+    constructed - imported,
+    (reconstructed - constructed) / 100,
+    parsed - reconstructed,
+)
+"""
+
+LABELS = (
+    "import tradierpy.client",
+    "first TradierClient()",
+    "later TradierClient()",
+    "first orders parse",
+)
+
+
+def main() -> None:
+    runs = [
+        [
+            float(t)
+            for t in subprocess.check_output([sys.executable, "-c", SNIPPET]).split()
+        ]
+        for _ in range(RUNS)
+    ]
+    for i, label in enumerate(LABELS):
+        print(f"{label:<24} {min(run[i] for run in runs) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Keeping the last N polled quotes per symbol: deques of quote models vs a
+TickBuffer, in memory and per-poll cost.
+
+    uv run --extra numpy python -m benchmarks.bench_tick_buffer
+"""
+
+import time
+import tracemalloc
+from collections import deque
+
+from benchmarks.payloads import quotes_payload
+from tradierpy.float_quote import FloatGetQuotesResponse
+from tradierpy.quote_columns import quote_columns
+from tradierpy.tick_buffer import TickBuffer
+
+SYMBOLS = [f"SYM{i}" for i in range(500)]
+CAPACITY = 256
+POLLS = 256
+
+
+def main() -> None:
+    payload = quotes_payload(SYMBOLS)
+
+    tracemalloc.start()
+    history = {symbol: deque(maxlen=CAPACITY) for symbol in SYMBOLS}
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        # A fresh response per poll, as from get_quotes
+        for quote in FloatGetQuotesResponse.model_validate(payload).quotes:
+            history[quote.symbol].append(quote)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{'deque of quotes':<16} {memory / 2**20:8.1f} MiB  "
+        f"{elapsed / POLLS * 1000:7.2f} ms/poll (validate + store)"
+    )
+    del history
+
+    ticks = TickBuffer(capacity=CAPACITY, symbols=len(SYMBOLS))
+    columns = quote_columns(FloatGetQuotesResponse.model_validate(payload))
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        ticks.add_columns(columns)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'TickBuffer':<16} {ticks.nbytes / 2**20:8.1f} MiB  "
+        f"{elapsed / POLLS * 1000:7.2f} ms/poll (store only)"
+    )
+
+    start = time.perf_counter()
+    for symbol in SYMBOLS:
+        ticks.vwap(symbol, n=100)
+        ticks.spread_stats(symbol, n=100)
+    elapsed = time.perf_counter() - start
+    print(f"vwap + spread_stats over 100 ticks: {elapsed / len(SYMBOLS) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
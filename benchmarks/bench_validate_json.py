@@ -0,0 +1,52 @@
+"""Response parsing with res.json() vs fast mode (raw bytes in pydantic-core).
+
+    uv run python -m benchmarks.bench_validate_json
+
+Fast mode skips building the intermediate Python dicts that res.json() returns.
+"""
+
+import json
+import timeit
+
+from httpx import Response
+
+from benchmarks.payloads import (
+    option_quotes_payload,
+    option_symbols,
+    orders,
+    orders_payload,
+)
+from tradierpy.client import TradierClient
+from tradierpy.order import GetOrdersResponse
+from tradierpy.quote import GetQuotesResponse
+
+PAYLOADS = {
+    "10,000 orders": (GetOrdersResponse, orders_payload(orders(10_000))),
+    "5,000 option quotes": (
+        GetQuotesResponse,
+        option_quotes_payload(option_symbols("SPY", 5_000)),
+    ),
+}
+
+
+def main() -> None:
+    for name, (model, payload) in PAYLOADS.items():
+        content = json.dumps(payload).encode()
+        slow = TradierClient.validate_json_response(model)
+        fast = TradierClient.validate_json_response(model, fast=True)
+        assert slow(Response(200, content=content)) == fast(
+            Response(200, content=content)
+        )
+
+        print(f"{name} ({len(content) / 1e6:.1f} MB)")
+        for mode, parse in (("res.json()", slow), ("fast (pydantic-core)", fast)):
+            best = min(
+                timeit.repeat(
+                    lambda: parse(Response(200, content=content)), number=1, repeat=5
+                )
+            )
+            print(f"  {mode:<26} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Minimal HTTP stand-ins for api.tradier.com used by the benchmarks.
+
+`MockTradierServer` speaks just enough HTTP/1.1 (keep-alive, Content-Length bodies) for
+httpx; `MockTradierH2Server` speaks plaintext HTTP/2 with prior knowledge. Both hand
+each request to a handler that returns the JSON payload to send back, optionally after
+a simulated network `latency` in seconds.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Self
+from urllib.parse import parse_qs, urlsplit
+
+# (method, path, query params, form body) -> JSON payload
+Handler = Callable[[str, str, dict[str, str], dict[str, str]], Any]
+
+
+class MockTradierServer:
+    def __init__(self, handler: Handler, host: str = "127.0.0.1", latency: float = 0):
+        self.handler = handler
+        self.host = host
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{self.host}:{port}/v1"
+
+    async def __aenter__(self) -> Self:
+        self._server = await asyncio.start_server(self._serve, self.host, 0)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def respond(self, method: str, target: str, body: bytes) -> bytes:
+        url = urlsplit(target)
+        path = url.path.removeprefix("/v1")
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        form = {k: v[-1] for k, v in parse_qs(body.decode()).items()}
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return json.dumps(self.handler(method, path, params, form)).encode()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                payload = await self.respond(method, target, body)
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload)
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class MockTradierH2Server(MockTradierServer):
+    """HTTP/2 (h2c, prior knowledge) variant. Requires the `h2` package."""
+
+    def __init__(
+        self,
+        handler: Handler,
+        host: str = "127.0.0.1",
+        latency: float = 0,
+        max_concurrent_streams: int = 100,
+    ):
+        super().__init__(handler, host, latency)
+        self.max_concurrent_streams = max_concurrent_streams
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.settings
+
+        self.connections += 1
+        conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        max_streams = h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS
+        conn.update_settings({max_streams: self.max_concurrent_streams})
+        writer.write(conn.data_to_send())
+
+        requests: dict[int, tuple[dict[str, str], bytearray]] = {}
+        window_updated = asyncio.Event()
+        tasks = set()
+
+        async def send_response(stream_id: int, headers: dict[str, str], body: bytes):
+            payload = await self.respond(headers[":method"], headers[":path"], body)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(payload))),
+                ],
+            )
+            while payload:
+                window = min(
+                    conn.local_flow_control_window(stream_id),
+                    conn.max_outbound_frame_size,
+                )
+                if window <= 0:
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                chunk, payload = payload[:window], payload[window:]
+                conn.send_data(stream_id, chunk, end_stream=not payload)
+                writer.write(conn.data_to_send())
+
+        try:
+            while data := await reader.read(65536):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        requests[event.stream_id] = (dict(event.headers), bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        requests[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = requests.pop(event.stream_id)
+                        task = asyncio.create_task(
+                            send_response(event.stream_id, headers, bytes(body))
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        window_updated.set()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
@@ -0,0 +1,149 @@
+"""Websocket stand-ins for Tradier's market and account events streams, used by the
+benchmarks.
+
+Pair them with a `MockTradierServer` answering the session request, e.g. with
+`lambda *_: stream_session(stream_server.url)`.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Optional, Self
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from benchmarks.payloads import quote_event
+
+# (symbol, sequence number) -> event payload
+EventMaker = Callable[[str, int], dict[str, Any]]
+
+
+class MockMarketStreamServer:
+    """Waits for a subscription payload, then sends one message per `interval`
+    seconds (0 for as fast as possible) with an event for every subscribed symbol.
+
+    New subscription payloads replace the symbol list, as with Tradier; all of them
+    are kept in `subscriptions`. After `messages` messages the server closes the
+    connection cleanly.
+    """
+
+    def __init__(
+        self,
+        make_event: EventMaker = quote_event,
+        *,
+        host: str = "127.0.0.1",
+        interval: float = 0,
+        messages: Optional[int] = None,
+    ):
+        self.make_event = make_event
+        self.host = host
+        self.interval = interval
+        self.messages = messages
+        self.connections = 0
+        self.subscriptions: list[dict[str, Any]] = []
+        self._server: Server | None = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://{self.host}:{port}/v1/markets/events"
+
+    async def __aenter__(self) -> Self:
+        self._server = await serve(self._serve, self.host, 0)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, websocket: ServerConnection) -> None:
+        self.connections += 1
+        symbols = self._subscribe(await websocket.recv())
+
+        async def read() -> None:
+            nonlocal symbols
+            async for message in websocket:
+                symbols = self._subscribe(message)
+
+        reader = asyncio.create_task(read())
+        try:
+            seq = 0
+            while self.messages is None or seq < self.messages:
+                if symbols:
+                    await websocket.send(
+                        "\n".join(json.dumps(self.make_event(s, seq)) for s in symbols)
+                    )
+                seq += 1
+                # Also lets the reader pick up subscription changes
+                await asyncio.sleep(self.interval)
+            await websocket.close()
+        except ConnectionClosed:
+            pass
+        finally:
+            reader.cancel()
+
+    def _subscribe(self, message: str | bytes) -> list[str]:
+        subscription = json.loads(message)
+        self.subscriptions.append(subscription)
+        return subscription["symbols"]
+
+
+class MockAccountStreamServer:
+    """Stand-in for Tradier's account events stream. Order events passed to
+    `publish` go to every connected client; ones published while nobody is connected
+    are lost, as they would be. `drop()` closes every connection abnormally so
+    clients have to reconnect.
+    """
+
+    def __init__(self, *, host: str = "127.0.0.1", heartbeat: float = 1.0):
+        self.host = host
+        self.heartbeat = heartbeat
+        self.connections = 0
+        self.subscriptions: list[dict[str, Any]] = []
+        self._clients: set[ServerConnection] = set()
+        self._server: Server | None = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://{self.host}:{port}/v1/accounts/events"
+
+    async def __aenter__(self) -> Self:
+        self._server = await serve(self._serve, self.host, 0)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def wait_connected(self) -> None:
+        while not self._clients:
+            await asyncio.sleep(0.01)
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        message = json.dumps(event)
+        for websocket in list(self._clients):
+            try:
+                await websocket.send(message)
+            except ConnectionClosed:
+                pass
+
+    async def drop(self) -> None:
+        clients, self._clients = self._clients, set()
+        for websocket in clients:
+            await websocket.close(code=1011, reason="dropped")
+
+    async def _serve(self, websocket: ServerConnection) -> None:
+        self.connections += 1
+        self.subscriptions.append(json.loads(await websocket.recv()))
+        self._clients.add(websocket)
+        try:
+            while True:
+                await asyncio.sleep(self.heartbeat)
+                await websocket.send(
+                    json.dumps({"event": "heartbeat", "status": "active"})
+                )
+        except ConnectionClosed:
+            pass
+        finally:
+            self._clients.discard(websocket)
@@ -0,0 +1,219 @@
+"""Synthetic Tradier API payloads shaped like the real responses."""
+
+from typing import Any
+
+
+def stock_quote(symbol: str) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "description": f"{symbol} Inc",
+        "exch": "Q",
+        "type": "stock",
+        "last": 208.21,
+        "change": -1.07,
+        "volume": 41736339,
+        "open": 209.8,
+        "high": 210.94,
+        "low": 207.44,
+        "close": None,
+        "bid": 208.2,
+        "ask": 208.23,
+        "change_percentage": -0.52,
+        "average_volume": 56423720,
+        "last_volume": 100,
+        "trade_date": 1727467200000,
+        "prevclose": 209.28,
+        "week_52_high": 237.23,
+        "week_52_low": 164.08,
+        "bidsize": 3,
+        "bidexch": "Q",
+        "bid_date": 1727467199000,
+        "asksize": 2,
+        "askexch": "Q",
+        "ask_date": 1727467199000,
+        "root_symbols": symbol,
+    }
+
+
+def quotes_payload(symbols: list[str]) -> dict[str, Any]:
+    quotes = [stock_quote(s) for s in symbols]
+    return {"quotes": {"quote": quotes[0] if len(quotes) == 1 else quotes}}
+
+
+def option_quote(symbol: str) -> dict[str, Any]:
+    return {
+        **stock_quote(symbol),
+        "description": f"{symbol} option",
+        "type": "option",
+        "root_symbols": None,
+        "open_interest": 1834,
+        "contract_size": 100,
+        "expiration_date": "2024-10-18",
+        "expiration_type": "standard",
+        "option_type": "call" if symbol[-9] == "C" else "put",
+        "root_symbol": symbol[:-15],
+        "greeks": {
+            "delta": 0.5129,
+            "gamma": 0.0412,
+            "theta": -0.2081,
+            "vega": 0.1835,
+            "rho": 0.0511,
+            "phi": -0.0533,
+            "bid_iv": 0.1563,
+            "mid_iv": 0.1579,
+            "ask_iv": 0.1595,
+            "smv_vol": 0.158,
+            "updated_at": "2024-09-27 20:00:00",
+        },
+    }
+
+
+def option_symbols(root: str, count: int) -> list[str]:
+    return [
+        f"{root}241018{'CP'[i % 2]}{(100_000 + 500 * (i // 2)):08d}"
+        for i in range(count)
+    ]
+
+
+def option_quotes_payload(symbols: list[str]) -> dict[str, Any]:
+    quotes = [option_quote(s) for s in symbols]
+    return {"quotes": {"quote": quotes[0] if len(quotes) == 1 else quotes}}
+
+
+def _base_order(order_id: int, status: str) -> dict[str, Any]:
+    return {
+        "id": order_id,
+        "status": status,
+        "duration": "day",
+        "price": 1.05,
+        "avg_fill_price": 1.05 if status == "filled" else 0.0,
+        "exec_quantity": 1 if status == "filled" else 0,
+        "last_fill_price": 1.05 if status == "filled" else 0.0,
+        "last_fill_quantity": 1 if status == "filled" else 0,
+        "remaining_quantity": 0 if status == "filled" else 1,
+        "create_date": "2024-09-27T14:31:07.452Z",
+        "transaction_date": "2024-09-27T14:31:09.113Z",
+        "tag": f"bench-{order_id}",
+    }
+
+
+def equity_order(order_id: int, status: str = "filled") -> dict[str, Any]:
+    return {
+        **_base_order(order_id, status),
+        "type": "limit",
+        "symbol": "SPY",
+        "side": "buy",
+        "quantity": 1,
+        "class": "equity",
+    }
+
+
+def option_order(order_id: int, status: str = "filled") -> dict[str, Any]:
+    return {
+        **_base_order(order_id, status),
+        "type": "limit",
+        "symbol": "SPY",
+        "side": "buy_to_open",
+        "quantity": 1,
+        "class": "option",
+        "option_symbol": "SPY241018C00575000",
+    }
+
+
+def multileg_order(order_id: int, status: str = "filled") -> dict[str, Any]:
+    legs = [
+        {**option_order(order_id * 10 + i, status), "type": "debit", "side": side}
+        for i, side in enumerate(("buy_to_open", "sell_to_open"))
+    ]
+    return {
+        **_base_order(order_id, status),
+        "type": "debit",
+        "symbol": "SPY",
+        "side": "buy",
+        "quantity": 1,
+        "class": "multileg",
+        "num_legs": 2,
+        "strategy": "spread",
+        "leg": legs,
+    }
+
+
+def orders(count: int, open_every: int = 0) -> list[dict[str, Any]]:
+    """`count` orders cycling equity, option and multileg; every `open_every`th one
+    is open rather than filled."""
+    makers = (equity_order, option_order, multileg_order)
+    return [
+        makers[i % 3](i + 1, "open" if open_every and i % open_every == 0 else "filled")
+        for i in range(count)
+    ]
+
+
+def orders_payload(order_list: list[dict[str, Any]]) -> dict[str, Any]:
+    if not order_list:
+        return {"orders": "null"}
+    return {"orders": {"order": order_list[0] if len(order_list) == 1 else order_list}}
+
+
+def stream_session(url: str) -> dict[str, Any]:
+    return {"stream": {"url": url, "sessionid": "bench-session"}}
+
+
+def quote_event(symbol: str, seq: int = 0) -> dict[str, Any]:
+    bid = 100 + seq % 100 / 100
+    return {
+        "type": "quote",
+        "symbol": symbol,
+        "bid": bid,
+        "bidsz": 10,
+        "bidexch": "Q",
+        "biddate": "1727447469000",
+        "ask": round(bid + 0.01, 2),
+        "asksz": 12,
+        "askexch": "Z",
+        "askdate": "1727447469000",
+    }
+
+
+def trade_event(symbol: str, seq: int = 0) -> dict[str, Any]:
+    price = f"{100 + seq % 100 / 100:.2f}"
+    return {
+        "type": "trade",
+        "symbol": symbol,
+        "exch": "Q",
+        "price": price,
+        "size": "100",
+        "cvol": str(1_000_000 + 100 * seq),
+        "date": "1727447469000",
+        "last": price,
+    }
+
+
+def summary_event(symbol: str, seq: int = 0) -> dict[str, Any]:
+    return {
+        "type": "summary",
+        "symbol": symbol,
+        "open": "99.50",
+        "high": "101.00",
+        "low": "99.00",
+        "prevClose": "99.75",
+    }
+
+
+def order_event(order_id: int, status: str = "filled") -> dict[str, Any]:
+    filled = 1 if status == "filled" else 0
+    return {
+        "id": order_id,
+        "event": "order",
+        "status": status,
+        "type": "limit",
+        "price": 1.05,
+        "stop_price": 0.0,
+        "avg_fill_price": 1.05 if filled else 0.0,
+        "executed_quantity": float(filled),
+        "last_fill_quantity": float(filled),
+        "last_fill_price": 1.05 if filled else 0.0,
+        "remaining_quantity": float(1 - filled),
+        "transaction_date": "2024-09-27T14:31:09.113Z",
+        "create_date": "2024-09-27T14:31:07.452Z",
+        "account": "bench",
+    }
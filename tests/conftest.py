@@ -0,0 +1,25 @@
+from typing import Awaitable, Callable, Union
+
+import pytest
+from httpx import MockTransport, Request, Response
+
+from tradierpy.client import TradierClient
+
+Handler = Callable[[Request], Union[Response, Awaitable[Response]]]
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., TradierClient]:
+    """Makes TradierClients whose requests are answered by `handler` instead of the
+    network."""
+
+    def make(handler: Handler, **kwargs) -> TradierClient:
+        return TradierClient(
+            "test",
+            "test",
+            base_url="https://api.tradier.test/v1",
+            transport=MockTransport(handler),
+            **kwargs,
+        )
+
+    return make
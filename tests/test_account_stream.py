@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import Request, Response
+
+from benchmarks.mock_stream_server import MockAccountStreamServer
+from benchmarks.payloads import (
+    equity_order,
+    order_event,
+    orders_payload,
+    stream_session,
+)
+from tradierpy import account_stream
+from tradierpy.account_stream import AccountStream
+
+
+def order_at(order_id: int, status: str, transaction_date: datetime) -> dict:
+    return {
+        **equity_order(order_id, status),
+        "transaction_date": transaction_date.isoformat().replace("+00:00", "Z"),
+    }
+
+
+class AccountServer:
+    """Stream sessions pointing at `stream`, and `orders` for `get_orders`; the first
+    `failures` order listings fail."""
+
+    def __init__(self, stream: MockAccountStreamServer, failures: int = 0):
+        self.stream = stream
+        self.orders: list[dict] = []
+        self.failures = failures
+        self.listings = 0
+
+    def __call__(self, request: Request) -> Response:
+        if request.url.path.endswith("/events/session"):
+            return Response(200, json=stream_session(self.stream.url))
+        self.listings += 1
+        if self.listings <= self.failures:
+            return Response(503, text="Service Unavailable")
+        return Response(200, json=orders_payload(self.orders))
+
+
+async def collect(stream: AccountStream, events: list) -> None:
+    async for event in stream:
+        events.append(event)
+
+
+async def until(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def no_margin(monkeypatch):
+    monkeypatch.setattr(account_stream, "RECONCILE_MARGIN", timedelta(0))
+
+
+def run(mock_client, scenario, *, failures: int = 0):
+    async def main():
+        async with MockAccountStreamServer(heartbeat=0.05) as stream_server:
+            server = AccountServer(stream_server, failures)
+            async with mock_client(server) as tradier:
+                async with AccountStream(
+                    tradier, url=stream_server.url, reconnect_delay=0.01
+                ) as stream:
+                    events = []
+                    task = asyncio.create_task(collect(stream, events))
+                    await stream_server.wait_connected()
+                    try:
+                        await scenario(stream_server, server, stream, events)
+                    finally:
+                        task.cancel()
+            return stream_server, server, stream, events
+
+    return asyncio.run(main())
+
+
+def test_yields_order_events_without_repeats(mock_client):
+    async def scenario(stream_server, server, stream, events):
+        for status in ("open", "open", "filled", "filled"):
+            await stream_server.publish(order_event(1, status))
+        await until(lambda: len(events) == 2)
+        await asyncio.sleep(0.05)
+
+    stream_server, _, _, events = run(mock_client, scenario)
+    assert [(e.id, e.status) for e in events] == [(1, "open"), (1, "filled")]
+    assert not any(e.reconciled for e in events)
+    assert stream_server.subscriptions[0]["sessionid"] == "bench-session"
+
+
+def test_reconnects_and_reconciles_missed_updates(mock_client, no_margin):
+    async def scenario(stream_server, server, stream, events):
+        await stream_server.publish(order_event(1, "filled"))
+        await until(lambda: len(events) == 1)
+        # Updated while disconnected; order 1 is unchanged
+        now = datetime.now(timezone.utc)
+        server.orders = [order_at(1, "filled", now), order_at(2, "filled", now)]
+        await stream_server.drop()
+        await until(lambda: len(events) == 2)
+        await stream_server.wait_connected()
+        await stream_server.publish(order_event(3, "open"))
+        await until(lambda: len(events) == 3)
+
+    stream_server, _, stream, events = run(mock_client, scenario)
+    assert [(e.id, e.reconciled) for e in events] == [(1, False), (2, True), (3, False)]
+    assert stream.reconnects == 1
+    assert stream_server.connections == 2
+
+
+def test_reconciles_from_the_last_message(mock_client, no_margin):
+    async def scenario(stream_server, server, stream, events):
+        connected = datetime.now(timezone.utc)
+        # Let a few heartbeats through, then update an order just before the drop
+        await asyncio.sleep(0.15)
+        before_drop = datetime.now(timezone.utc)
+        server.orders = [
+            order_at(1, "filled", connected - timedelta(hours=1)),
+            order_at(2, "filled", before_drop),
+        ]
+        await stream_server.drop()
+        await until(lambda: stream.reconnects)
+        await asyncio.sleep(0.05)
+
+    _, _, _, events = run(mock_client, scenario)
+    assert [(e.id, e.reconciled) for e in events] == [(2, True)]
+
+
+def test_retries_failed_reconciliation(mock_client, no_margin):
+    async def scenario(stream_server, server, stream, events):
+        server.orders = [order_at(1, "filled", datetime.now(timezone.utc))]
+        await stream_server.drop()
+        await until(lambda: events)
+
+    _, server, _, events = run(mock_client, scenario, failures=2)
+    assert [(e.id, e.reconciled) for e in events] == [(1, True)]
+    assert server.listings == 3
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tradierpy.bars import BarAggregator
+
+# On a 5 minute boundary
+START = 1727447400000
+
+
+def snapshot(symbols, time, last, volume) -> dict:
+    n = len(symbols)
+    return {
+        "symbol": np.array(symbols),
+        "last": np.broadcast_to(np.asarray(last, dtype=np.float64), n).copy(),
+        "volume": np.broadcast_to(np.asarray(volume, dtype=np.int64), n).copy(),
+        "trade_date": np.full(n, time, dtype=np.int64),
+    }
+
+
+def test_bars_roll_over_at_interval_boundaries():
+    bars = BarAggregator(intervals=(1, 60))
+    for offset, price in ((0, 10), (400, 12), (999, 9), (1000, 11), (61_500, 13)):
+        bars.update("SPY", START + offset, price, 100)
+
+    seconds = bars.bars("SPY", 1)
+    assert (seconds["start"] - START).tolist() == [0, 1000, 61_000]
+    assert seconds["open"].tolist() == [10, 11, 13]
+    assert seconds["high"].tolist() == [12, 11, 13]
+    assert seconds["low"].tolist() == [9, 11, 13]
+    assert seconds["close"].tolist() == [9, 11, 13]
+    assert seconds["volume"].tolist() == [300, 100, 100]
+
+    minutes = bars.bars("SPY", 60)
+    assert (minutes["start"] - START).tolist() == [0, 60_000]
+    assert minutes["volume"].tolist() == [400, 100]
+    assert bars.bars("SPY", 60, n=1)["close"].tolist() == [13]
+
+
+def test_late_updates_fold_into_the_current_bar_and_history_is_bounded():
+    bars = BarAggregator(intervals=(1,), history=2)
+    for offset in (0, 1000, 2000):
+        bars.update("SPY", START + offset, 10, 1)
+    bars.update("SPY", START + 500, 15, 1)
+    latest = bars.bars("SPY", 1)
+    assert (latest["start"] - START).tolist() == [1000, 2000]
+    assert latest["high"].tolist() == [10, 15]
+    assert latest["volume"].tolist() == [1, 2]
+
+
+def test_snapshots_trade_the_volume_increase():
+    bars = BarAggregator(intervals=(60,))
+    # The first snapshot only sets the baseline
+    bars.add_columns(snapshot(["SPY", "QQQ"], START, 100, [1000, 500]))
+    assert bars.current(60)["symbol"].tolist() == []
+    bars.add_columns(snapshot(["SPY", "QQQ"], START + 1000, [101, 50], [1200, 500]))
+    bars.add_columns(snapshot(["SPY"], START + 2000, np.nan, 1300))
+    bars.add_columns(snapshot(["SPY"], START + 3000, 99, 1350))
+    current = bars.current(60)
+    assert current["symbol"].tolist() == ["SPY"]
+    assert current["volume"].tolist() == [250]
+    assert (current["open"][0], current["low"][0], current["close"][0]) == (101, 99, 99)
+
+
+def test_stream_trades_set_the_snapshot_baseline():
+    trade = SimpleNamespace(
+        type="trade",
+        symbol="SPY",
+        price=100.0,
+        size=10,
+        cvol=1000,
+        date=datetime.fromtimestamp(START / 1000, timezone.utc),
+    )
+    bars = BarAggregator(intervals=(60,))
+    bars.add_events([trade, SimpleNamespace(type="quote", symbol="SPY")])
+    bars.add_columns(snapshot(["SPY"], START + 5000, 101, 1200))
+    assert bars.bars("SPY", 60)["volume"].tolist() == [210]
+    assert bars.bars("SPY", 60)["high"].tolist() == [101]
+
+
+def test_current_stays_aligned_after_growth():
+    bars = BarAggregator(intervals=(60,), symbols=2)
+    symbols = [f"S{i}" for i in range(6)]
+    bars.add_columns(snapshot(symbols, START, 1, 0))
+    bars.add_columns(snapshot(symbols, START, np.arange(6) + 10, 100))
+    assert bars.symbols == symbols
+
+    current = bars.current(60, ["S5", "NOPE", "S0", "S3"])
+    assert current["symbol"].tolist() == ["S5", "S0", "S3"]
+    assert current["close"].tolist() == [15, 10, 13]
+    assert bars.current(60)["close"].tolist() == [10, 11, 12, 13, 14, 15]
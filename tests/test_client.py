@@ -0,0 +1,67 @@
+import asyncio
+from urllib.parse import parse_qs
+
+from httpx import Request, Response
+
+from benchmarks.mock_server import MockTradierServer
+from benchmarks.payloads import quotes_payload
+from tradierpy.client import TradierClient
+
+
+def quotes_handler(method, path, params, form):
+    return quotes_payload(form["symbols"].split(","))
+
+
+def test_calls_share_one_connection():
+    async def main():
+        async with MockTradierServer(quotes_handler) as server:
+            async with TradierClient("test", "test", base_url=server.url) as tradier:
+                for _ in range(5):
+                    await tradier.get_quotes("SPY")
+            return server.connections, server.requests
+
+    assert asyncio.run(main()) == (1, 5)
+
+
+def test_context_manager_closes_pool():
+    async def main():
+        async with TradierClient("test", "test") as tradier:
+            pass
+        return tradier._client.is_closed
+
+    assert asyncio.run(main())
+
+
+def test_large_symbol_lists_are_fetched_in_bounded_batches(mock_client):
+    symbols = [f"SYM{i}" for i in range(10)]
+    # The second and last batches each have an unmatched symbol
+    symbols[5:5] = ["BAD1"]
+    symbols.append("BAD2")
+    batches: list[list[str]] = []
+    in_flight = most_in_flight = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal in_flight, most_in_flight
+        batch = parse_qs(request.content.decode())["symbols"][0].split(",")
+        batches.append(batch)
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        # Later batches answer sooner, so responses arrive out of order
+        await asyncio.sleep(0.04 - 0.01 * (symbols.index(batch[0]) // 3))
+        in_flight -= 1
+        payload = quotes_payload([s for s in batch if not s.startswith("BAD")])
+        if unmatched := [s for s in batch if s.startswith("BAD")]:
+            payload["quotes"]["unmatched_symbols"] = {"symbol": unmatched}
+        return Response(200, json=payload)
+
+    async def main():
+        async with mock_client(
+            handler, quotes_batch_size=3, quotes_batch_concurrency=2
+        ) as tradier:
+            return await tradier.get_quotes(*symbols)
+
+    response = asyncio.run(main())
+    assert sorted(batches) == sorted(symbols[i : i + 3] for i in range(0, 12, 3))
+    assert most_in_flight == 2
+    assert [q.symbol for q in response.quotes] == [f"SYM{i}" for i in range(10)]
+    assert response.unmatched_symbols == ["BAD1", "BAD2"]
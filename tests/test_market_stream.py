@@ -0,0 +1,88 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from httpx import Request, Response
+
+from benchmarks.mock_stream_server import MockMarketStreamServer
+from benchmarks.payloads import quote_event, stream_session, summary_event, trade_event
+from tradierpy.market_stream import (
+    MarketStream,
+    QuoteEvent,
+    SummaryEvent,
+    TradeEvent,
+    parse_market_events,
+)
+
+
+def session_handler(server: MockMarketStreamServer):
+    def handler(request: Request) -> Response:
+        return Response(200, json=stream_session(server.url))
+
+    return handler
+
+
+def test_parse_market_events():
+    message = "\n".join(
+        [
+            json.dumps(quote_event("SPY")),
+            "",
+            json.dumps(trade_event("SPY", 5)),
+            json.dumps(summary_event("QQQ")),
+        ]
+    )
+    quote, trade, summary = parse_market_events(message)
+    assert isinstance(quote, QuoteEvent)
+    assert quote.ask == 100.01
+    assert quote.biddate == datetime(2024, 9, 27, 14, 31, 9, tzinfo=timezone.utc)
+    assert isinstance(trade, TradeEvent)
+    assert (trade.price, trade.size, trade.cvol) == (100.05, 100, 1_000_500)
+    assert isinstance(summary, SummaryEvent)
+    assert (summary.symbol, summary.prev_close, summary.close) == ("QQQ", 99.75, None)
+
+
+def test_subscription_changes_reuse_the_connection(mock_client):
+    async def main():
+        async with MockMarketStreamServer(interval=0.01) as server:
+            async with mock_client(session_handler(server)) as tradier:
+                async with MarketStream(tradier, ["spy"], url=server.url) as stream:
+                    await stream.subscribe("qqq", "IWM")
+                    await stream.unsubscribe("spy")
+                    seen = set()
+                    async with asyncio.timeout(2):
+                        async for event in stream:
+                            seen.add(event.symbol)
+                            if len(server.subscriptions) == 3 and "IWM" in seen:
+                                break
+                    return server, stream
+
+    server, stream = asyncio.run(main())
+    assert server.connections == 1
+    assert [s["symbols"] for s in server.subscriptions] == [
+        ["SPY"],
+        ["SPY", "QQQ", "IWM"],
+        ["QQQ", "IWM"],
+    ]
+    assert {s["sessionid"] for s in server.subscriptions} == {"bench-session"}
+    assert stream.symbols == ["QQQ", "IWM"]
+
+
+def test_iteration_stops_on_clean_close(mock_client):
+    async def main():
+        async with MockMarketStreamServer(trade_event, messages=3) as server:
+            async with mock_client(session_handler(server)) as tradier:
+                async with MarketStream(
+                    tradier, ["SPY", "QQQ"], url=server.url
+                ) as stream:
+                    async with asyncio.timeout(2):
+                        return [event async for event in stream]
+
+    events = asyncio.run(main())
+    assert [(e.symbol, e.cvol) for e in events] == [
+        ("SPY", 1_000_000),
+        ("QQQ", 1_000_000),
+        ("SPY", 1_000_100),
+        ("QQQ", 1_000_100),
+        ("SPY", 1_000_200),
+        ("QQQ", 1_000_200),
+    ]
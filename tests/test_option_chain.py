@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tradierpy.option_chain import OptionChainColumns, OptionChainIndex
+
+SYMBOLS = [
+    "SPY241018C00575000",
+    "SPY241018P00575500",
+    "SPY241115C00580000",
+    "GOOGL241018C00165000",
+    "BRKB1X241018P00450000",
+    "SPY241018C00575000",
+]
+
+
+def test_columns_round_trip():
+    columns = OptionChainColumns.from_symbols(SYMBOLS)
+    assert columns.symbols() == SYMBOLS
+    assert columns.roots == ("SPY", "GOOGL", "BRKB1X")
+    assert columns.root_code.tolist() == [0, 0, 0, 1, 2, 0]
+    assert columns.expiry[2] == np.datetime64("2024-11-15")
+    assert columns.is_call.tolist() == [True, False, True, True, False, True]
+    assert OptionChainColumns.from_symbols([]).symbols() == []
+
+
+def test_columns_parse_strikes_in_thousandths():
+    columns = OptionChainColumns.from_symbols(SYMBOLS)
+    assert columns.strike.tolist() == [575000, 575500, 580000, 165000, 450000, 575000]
+    assert columns.filter(strike_min=575.5, strike_max="575.5").symbols() == [
+        "SPY241018P00575500"
+    ]
+
+
+def test_columns_mask():
+    columns = OptionChainColumns.from_symbols(SYMBOLS)
+
+    def rows(**bounds) -> list[int]:
+        return np.flatnonzero(columns.mask(**bounds)).tolist()
+
+    assert rows(expiry_from=date(2024, 10, 19)) == [2]
+    assert rows(expiry_to=date(2024, 10, 18)) == [0, 1, 3, 4, 5]
+    assert rows(strike_min=500, strike_max=576) == [0, 1, 5]
+    assert columns.filter(option_type="put").symbols() == [
+        "SPY241018P00575500",
+        "BRKB1X241018P00450000",
+    ]
+    assert columns.filter(root="BRKB1X", option_type="put").symbols() == [
+        "BRKB1X241018P00450000"
+    ]
+    assert not columns.mask(root="QQQ").any()
+
+
+OCT18, OCT25 = date(2024, 10, 18), date(2024, 10, 25)
+
+
+def spx_chain() -> OptionChainColumns:
+    """SPX and SPXW listing the same strikes, SPXW with a second expiry."""
+    symbols = [
+        f"{root}{expiry:%y%m%d}{kind}0{strike}000"
+        for root, expiries in (("SPX", (OCT18,)), ("SPXW", (OCT18, OCT25)))
+        for expiry in expiries
+        for kind in "CP"
+        for strike in (5700, 5725, 5750, 5775, 5800)
+    ]
+    return OptionChainColumns.from_symbols(symbols)
+
+
+def test_index_requires_a_root_when_columns_have_several():
+    with pytest.raises(ValueError, match="SPX, SPXW"):
+        OptionChainIndex(spx_chain())
+
+
+def test_atm_straddle_stays_on_one_root():
+    index = OptionChainIndex(spx_chain(), root="SPXW")
+    assert index.atm_straddle(OCT18, 5752) == (
+        "SPXW241018C05750000",
+        "SPXW241018P05750000",
+    )
+    assert OptionChainIndex(spx_chain(), root="SPX").atm_straddle(OCT18, 5740) == (
+        "SPX241018C05750000",
+        "SPX241018P05750000",
+    )
+
+
+def test_nearest_strikes_are_distinct():
+    index = OptionChainIndex(spx_chain(), root="SPXW")
+    assert index.nearest_strikes(OCT18, 5750, 3, "call") == [
+        "SPXW241018C05725000",
+        "SPXW241018C05750000",
+        "SPXW241018C05775000",
+    ]
+    assert index.nearest_strikes(OCT25, 5810, 2, "put") == [
+        "SPXW241025P05775000",
+        "SPXW241025P05800000",
+    ]
+
+
+def test_expirations_between():
+    assert OptionChainIndex(spx_chain(), root="SPXW").expirations_between(
+        date(2024, 10, 1), date(2024, 10, 31)
+    ) == [OCT18, OCT25]
+    assert (
+        OptionChainIndex(spx_chain(), root="SPX").expirations_between(OCT25, OCT25)
+        == []
+    )
+
+
+def test_single_root_needs_no_root_argument():
+    columns = spx_chain()
+    index = OptionChainIndex(columns.filter(root="SPX"))
+    assert len(index) == 10
+    assert index.atm_straddle(OCT25, 5750) is None
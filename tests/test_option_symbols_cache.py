@@ -0,0 +1,86 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from benchmarks.payloads import option_symbols
+from tradierpy import option_symbols_cache
+from tradierpy.option_symbols import GetOptionSymbolsResponse
+from tradierpy.option_symbols_cache import OptionSymbolsCache
+
+YESTERDAY, TODAY = date(2024, 10, 17), date(2024, 10, 18)
+
+
+def response(count: int) -> GetOptionSymbolsResponse:
+    return GetOptionSymbolsResponse.model_validate(
+        {"symbols": [{"rootSymbol": "SPY", "options": option_symbols("SPY", count)}]}
+    )
+
+
+class Fetcher:
+    """Counts fetches, each taking `delay` seconds and listing `count` options."""
+
+    def __init__(self, count: int = 4, delay: float = 0):
+        self.count = count
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, underlying: str) -> GetOptionSymbolsResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return response(self.count)
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """Settable trading date as seen by the cache."""
+    current = [TODAY]
+    monkeypatch.setattr(option_symbols_cache, "trading_date", lambda: current[0])
+    return current
+
+
+def test_loads_from_disk_without_fetching(tmp_path, today):
+    fetch = Fetcher()
+
+    async def main():
+        first = await OptionSymbolsCache(tmp_path).get("SPY", fetch)
+        # A fresh cache, as after a restart
+        second = await OptionSymbolsCache(tmp_path).get("SPY", fetch)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second == response(4)
+    assert fetch.calls == 1
+    assert [p.name for p in (tmp_path / "SPY").iterdir()] == ["2024-10-18.json"]
+
+
+def test_stale_day_is_served_while_refreshing(tmp_path, today):
+    today[0] = YESTERDAY
+    asyncio.run(OptionSymbolsCache(tmp_path).get("SPY", Fetcher(count=2)))
+    today[0] = TODAY
+    fetch = Fetcher(count=6, delay=0.01)
+
+    async def main():
+        cache = OptionSymbolsCache(tmp_path)
+        stale = await cache.get("SPY", fetch)
+        again = await cache.get("SPY", fetch)
+        await asyncio.sleep(0.05)
+        return stale, again, await cache.get("SPY", fetch)
+
+    stale, again, fresh = asyncio.run(main())
+    assert stale == again == response(2)
+    assert fresh == response(6)
+    assert fetch.calls == 1
+    # Yesterday's file is cleaned up
+    assert [p.name for p in (tmp_path / "SPY").iterdir()] == ["2024-10-18.json"]
+
+
+def test_concurrent_cold_gets_share_one_fetch(tmp_path, today):
+    fetch = Fetcher(delay=0.01)
+
+    async def main():
+        cache = OptionSymbolsCache(tmp_path)
+        return await asyncio.gather(*(cache.get("SPY", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == [response(4)] * 5
+    assert fetch.calls == 1
@@ -0,0 +1,63 @@
+import asyncio
+
+from httpx import Request, Response
+
+from benchmarks.payloads import equity_order, orders_payload
+from tradierpy.order import GetOrdersResponse, OrderResponse
+from tradierpy.order_cache import FinalizedOrderCache
+
+
+def order(order_id: int, status: str = "filled") -> OrderResponse:
+    payload = orders_payload([equity_order(order_id, status)])
+    return GetOrdersResponse.model_validate(payload).orders[0]
+
+
+def test_only_final_orders_are_cached():
+    cache = FinalizedOrderCache()
+    assert not cache.put(order(1, "open"))
+    assert cache.put(order(2, "canceled"))
+    assert cache.get(1) is None
+    assert cache.get(2) == order(2, "canceled")
+
+
+def test_evicts_least_recently_used():
+    cache = FinalizedOrderCache(max_entries=2)
+    cache.put(order(1))
+    cache.put(order(2))
+    cache.get(1)
+    cache.put(order(3))
+    assert len(cache) == 2
+    assert cache.get(1) is not None
+    assert cache.get(2) is None
+
+
+def test_directory_survives_restarts_and_evictions(tmp_path):
+    cache = FinalizedOrderCache(tmp_path, max_entries=1)
+    cache.put(order(1))
+    cache.put(order(2))
+    assert cache.get(1) == order(1)
+
+    restarted = FinalizedOrderCache(tmp_path)
+    assert restarted.get(1) == order(1)
+    assert restarted.get(2) == order(2)
+    assert restarted.get(3) is None
+
+
+def test_get_order_reads_through(mock_client):
+    requested = []
+
+    def handler(request: Request) -> Response:
+        order_id = int(request.url.path.rsplit("/", 1)[1])
+        requested.append(order_id)
+        status = "open" if order_id == 1 else "filled"
+        return Response(200, json=orders_payload([equity_order(order_id, status)]))
+
+    async def main():
+        cache = FinalizedOrderCache()
+        async with mock_client(handler, finalized_order_cache=cache) as tradier:
+            for order_id in (1, 2, 1, 2):
+                response = await tradier.get_order(order_id)
+                assert response.orders[0].id == order_id
+
+    asyncio.run(main())
+    assert requested == [1, 2, 1]
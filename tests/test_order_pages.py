@@ -0,0 +1,143 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+from httpx import Request, Response
+
+from benchmarks.payloads import orders, orders_payload
+from tradierpy import client
+from tradierpy.order import OrderStatus
+
+FIRST_DAY = date(2024, 1, 1)
+DAYS = 20
+SINCE = datetime.combine(FIRST_DAY, datetime.min.time())
+UNTIL = SINCE + timedelta(days=DAYS - 1)
+
+
+class OrderHistoryServer:
+    """Pages through orders spread evenly over DAYS, oldest first, recording the
+    params of every request. Requests for `failing_day` get an error response."""
+
+    def __init__(self, count: int = 100, failing_day: date | None = None):
+        self.history = [
+            (FIRST_DAY + timedelta(days=i * DAYS // count), order)
+            for i, order in enumerate(orders(count, open_every=3))
+        ]
+        self.failing_day = failing_day
+        self.requests: list[dict[str, str]] = []
+
+    def __call__(self, request: Request) -> Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        start = date.fromisoformat(params["start"])
+        end = date.fromisoformat(params["end"]) if "end" in params else date.max
+        if self.failing_day is not None and start <= self.failing_day <= end:
+            return Response(200, json={"errors": {"error": "Backoffice unavailable"}})
+        statuses = params["status"].split(",") if "status" in params else None
+        page, limit = int(params["page"]), int(params["limit"])
+        matched = [
+            order
+            for day, order in self.history
+            if start <= day <= end and (statuses is None or order["status"] in statuses)
+        ]
+        return Response(
+            200, json=orders_payload(matched[(page - 1) * limit : page * limit])
+        )
+
+
+def ids(pages) -> list[int]:
+    return [order.id for page in pages for order in page.orders]
+
+
+def test_get_orders_follows_full_pages(mock_client, monkeypatch):
+    monkeypatch.setattr(client, "ORDERS_PAGE_LIMIT", 30)
+    server = OrderHistoryServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            eager = await tradier.get_orders(SINCE)
+            lazy = await tradier.get_orders_lazy(SINCE)
+            return eager, lazy
+
+    eager, lazy = asyncio.run(main())
+    assert [o.id for o in eager.orders] == list(range(1, 101))
+    assert [o.id for o in lazy.orders] == list(range(1, 101))
+    assert [r["page"] for r in server.requests] == ["1", "2", "3", "4"] * 2
+
+
+def test_get_orders_stops_after_an_exactly_full_page(mock_client, monkeypatch):
+    monkeypatch.setattr(client, "ORDERS_PAGE_LIMIT", 50)
+    server = OrderHistoryServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            return await tradier.get_orders(SINCE)
+
+    assert len(asyncio.run(main()).orders) == 100
+    # The empty third page ends it
+    assert len(server.requests) == 3
+
+
+def test_iter_orders_pages(mock_client):
+    server = OrderHistoryServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            return [page async for page in tradier.iter_orders(SINCE, page_size=40)]
+
+    pages = asyncio.run(main())
+    assert [len(page.orders) for page in pages] == [40, 40, 20]
+    assert ids(pages) == list(range(1, 101))
+
+
+def test_iter_orders_windows_cover_the_range_once(mock_client):
+    server = OrderHistoryServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            return [
+                page
+                async for page in tradier.iter_orders(
+                    SINCE, UNTIL, page_size=10, window=timedelta(days=7)
+                )
+            ]
+
+    pages = asyncio.run(main())
+    assert sorted(ids(pages)) == list(range(1, 101))
+    windows = sorted({(r["start"], r["end"]) for r in server.requests})
+    assert windows == [
+        ("2024-01-01", "2024-01-07"),
+        ("2024-01-08", "2024-01-14"),
+        ("2024-01-15", "2024-01-20"),
+    ]
+
+
+def test_iter_orders_filters(mock_client):
+    server = OrderHistoryServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            return [
+                page
+                async for page in tradier.iter_orders(
+                    SINCE, UNTIL, window=timedelta(days=5), status=OrderStatus.OPEN
+                )
+            ]
+
+    pages = asyncio.run(main())
+    assert sorted(ids(pages)) == list(range(1, 101, 3))
+    assert {r["status"] for r in server.requests} == {"open"}
+
+
+def test_iter_orders_window_error_propagates(mock_client):
+    server = OrderHistoryServer(failing_day=date(2024, 1, 10))
+
+    async def main():
+        async with mock_client(server) as tradier:
+            async for _ in tradier.iter_orders(
+                SINCE, UNTIL, page_size=5, window=timedelta(days=2)
+            ):
+                pass
+
+    with pytest.raises(ValueError, match="Backoffice unavailable"):
+        asyncio.run(main())
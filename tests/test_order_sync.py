@@ -0,0 +1,110 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from httpx import Request, Response
+
+from benchmarks.payloads import equity_order, orders_payload
+from tradierpy import order_sync
+from tradierpy.order import OrderStatus
+from tradierpy.order_sync import OrderSynchronizer
+
+DAY1, DAY2 = date(2024, 9, 26), date(2024, 9, 27)
+
+
+class OrdersServer:
+    """Orders by the trading date they were placed on; listing returns those placed on
+    or after `start`, and single orders are looked up by id."""
+
+    def __init__(self):
+        self.orders: dict[int, tuple[date, dict]] = {}
+        self.single_lookups: list[int] = []
+
+    def place(self, placed: date, order_id: int, status: str = "open") -> None:
+        self.orders[order_id] = (placed, equity_order(order_id, status))
+
+    def update(self, order_id: int, status: str) -> None:
+        placed, _ = self.orders[order_id]
+        self.orders[order_id] = (placed, equity_order(order_id, status))
+
+    def __call__(self, request: Request) -> Response:
+        path = request.url.path
+        if not path.endswith("/orders"):
+            order_id = int(path.rsplit("/", 1)[1])
+            self.single_lookups.append(order_id)
+            return Response(200, json=orders_payload([self.orders[order_id][1]]))
+        start = date.fromisoformat(request.url.params["start"])
+        return Response(
+            200,
+            json=orders_payload(
+                [order for placed, order in self.orders.values() if placed >= start]
+            ),
+        )
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """Settable trading date as seen by the synchronizer."""
+    current = [DAY1]
+    monkeypatch.setattr(order_sync, "trading_date", lambda: current[0])
+    return current
+
+
+def test_sync_reports_new_changed_and_finalized(mock_client, today):
+    server = OrdersServer()
+    server.place(DAY1, 1)
+    server.place(DAY1, 2)
+
+    async def main():
+        async with mock_client(server) as tradier:
+            sync = OrderSynchronizer(tradier)
+            first = await sync.sync()
+            server.update(1, "partially_filled")
+            server.update(2, "filled")
+            second = await sync.sync()
+            third = await sync.sync()
+            return sync, first, second, third
+
+    sync, first, second, third = asyncio.run(main())
+    assert [o.id for o in first.new] == [1, 2]
+    assert [o.id for o in second.changed] == [1]
+    assert [o.id for o in second.finalized] == [2]
+    assert third == order_sync.OrderSyncDelta()
+    assert [o.id for o in sync.open_orders] == [1]
+    assert sync.orders[1].status == OrderStatus.PARTIALLY_FILLED
+
+
+def test_discovers_orders_placed_late_on_the_previous_day(mock_client, today):
+    server = OrdersServer()
+    server.place(DAY1, 1)
+
+    async def main():
+        async with mock_client(server) as tradier:
+            sync = OrderSynchronizer(tradier)
+            await sync.sync()
+            # Placed after that sync but before midnight
+            server.place(DAY1, 2, "filled")
+            today[0] = DAY2
+            return await sync.sync()
+
+    delta = asyncio.run(main())
+    assert [o.id for o in delta.new] == [2]
+
+
+def test_rechecks_open_orders_from_before_the_window(mock_client, today):
+    server = OrdersServer()
+    server.place(DAY1, 1)
+
+    async def main():
+        async with mock_client(server) as tradier:
+            sync = OrderSynchronizer(tradier, since=datetime(2024, 9, 1))
+            await sync.sync()
+            today[0] = DAY2
+            await sync.sync()
+            today[0] = date(2024, 9, 28)
+            server.update(1, "canceled")
+            return await sync.sync()
+
+    delta = asyncio.run(main())
+    assert [o.id for o in delta.finalized] == [1]
+    assert server.single_lookups == [1]
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Sequence
+
+import pytest
+
+from benchmarks.payloads import quotes_payload
+from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_aggregator import QuoteAggregator
+
+
+class Fetcher:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.calls: list[Sequence[str]] = []
+
+    async def __call__(self, symbols: Sequence[str]) -> GetQuotesResponse:
+        self.calls.append(symbols)
+        await asyncio.sleep(self.delay)
+        return GetQuotesResponse.model_validate(quotes_payload(list(symbols)))
+
+
+def symbols(response: GetQuotesResponse) -> list[str]:
+    return [q.symbol for q in response.quotes]
+
+
+def test_concurrent_calls_share_one_request():
+    fetch = Fetcher()
+
+    async def main():
+        aggregator = QuoteAggregator(fetch, 0.01)
+        return await asyncio.gather(
+            aggregator.get_quotes(["SPY", "QQQ"]), aggregator.get_quotes(["QQQ", "IWM"])
+        )
+
+    first, second = asyncio.run(main())
+    assert fetch.calls == [["SPY", "QQQ", "IWM"]]
+    assert symbols(first) == ["SPY", "QQQ"]
+    assert symbols(second) == ["QQQ", "IWM"]
+
+
+def test_fetch_error_reaches_every_caller():
+    async def fetch(symbols):
+        raise ValueError("boom")
+
+    async def main():
+        aggregator = QuoteAggregator(fetch, 0.01)
+        return await asyncio.gather(
+            aggregator.get_quotes(["SPY"]),
+            aggregator.get_quotes(["QQQ"]),
+            return_exceptions=True,
+        )
+
+    assert [str(e) for e in asyncio.run(main())] == ["boom", "boom"]
+
+
+@pytest.mark.parametrize("cancel_after", [0.005, 0.03])
+def test_cancelled_flush_cancels_callers(cancel_after):
+    """Whether cancelled during the window (0.02s) or during the fetch."""
+
+    async def main():
+        aggregator = QuoteAggregator(Fetcher(delay=1), 0.02)
+        callers = [
+            asyncio.create_task(aggregator.get_quotes([s])) for s in ("SPY", "QQQ")
+        ]
+        await asyncio.sleep(0)
+        flush = aggregator._flush_task
+        await asyncio.sleep(cancel_after)
+        flush.cancel()
+        return await asyncio.wait_for(
+            asyncio.gather(*callers, return_exceptions=True), 1
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
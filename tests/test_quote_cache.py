@@ -0,0 +1,93 @@
+import asyncio
+import time
+from urllib.parse import parse_qs
+
+from httpx import Request, Response
+
+from benchmarks.payloads import quotes_payload
+from tradierpy.quote import GetQuotesResponse, StockQuote
+from tradierpy.quote_cache import QuoteCache, UnmatchedSymbolCache
+
+
+def quotes(*symbols: str) -> list[StockQuote]:
+    return GetQuotesResponse.model_validate(quotes_payload(list(symbols))).quotes
+
+
+class QuotesServer:
+    def __init__(self):
+        self.requested: list[list[str]] = []
+
+    def __call__(self, request: Request) -> Response:
+        symbols = parse_qs(request.content.decode())["symbols"][0].split(",")
+        self.requested.append(symbols)
+        return Response(200, json=quotes_payload(symbols))
+
+
+def test_lookup_splits_fresh_and_missing():
+    cache = QuoteCache()
+    cache.store(quotes("SPY", "QQQ"))
+    fresh, missing = cache.lookup(["spy", "IWM"])
+    assert [q.symbol for q in fresh] == ["SPY"]
+    assert missing == ["IWM"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_quotes_expire_after_ttl():
+    cache = QuoteCache({StockQuote: 0.01})
+    cache.store(quotes("SPY"))
+    time.sleep(0.02)
+    assert cache.lookup(["SPY"]) == ([], ["SPY"])
+
+
+def test_evicts_least_recently_used():
+    cache = QuoteCache(max_entries=2)
+    cache.store(quotes("SPY", "QQQ"))
+    cache.lookup(["SPY"])
+    cache.store(quotes("IWM"))
+    assert cache.lookup(["QQQ"])[1] == ["QQQ"]
+    assert len(cache.lookup(["SPY", "IWM"])[0]) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_get_quotes_only_fetches_missing_symbols(mock_client):
+    server = QuotesServer()
+
+    async def main():
+        async with mock_client(server, quote_cache=QuoteCache()) as tradier:
+            await tradier.get_quotes("SPY", "QQQ")
+            return await tradier.get_quotes("QQQ", "IWM", "SPY")
+
+    response = asyncio.run(main())
+    assert server.requested == [["SPY", "QQQ"], ["IWM"]]
+    assert [q.symbol for q in response.quotes] == ["QQQ", "IWM", "SPY"]
+
+
+def test_unmatched_symbols_expire_and_are_bounded():
+    cache = UnmatchedSymbolCache(ttl=0.01, max_entries=2)
+    cache.store(["BOGUS1", "BOGUS2", "BOGUS3"])
+    assert len(cache) == 2
+    assert cache.lookup(["bogus3", "SPY"]) == (["bogus3"], ["SPY"])
+    time.sleep(0.02)
+    assert cache.lookup(["BOGUS3"]) == ([], ["BOGUS3"])
+
+
+def test_get_quotes_does_not_resend_unmatched_symbols(mock_client):
+    requested = []
+
+    def handler(request: Request) -> Response:
+        symbols = parse_qs(request.content.decode())["symbols"][0].split(",")
+        requested.append(symbols)
+        payload = quotes_payload([s for s in symbols if s != "BOGUS"])
+        if "BOGUS" in symbols:
+            payload["quotes"]["unmatched_symbols"] = {"symbol": "BOGUS"}
+        return Response(200, json=payload)
+
+    async def main():
+        cache = UnmatchedSymbolCache()
+        async with mock_client(handler, unmatched_symbol_cache=cache) as tradier:
+            await tradier.get_quotes("SPY", "BOGUS")
+            return await tradier.get_quotes("SPY", "BOGUS")
+
+    response = asyncio.run(main())
+    assert requested == [["SPY", "BOGUS"], ["SPY"]]
+    assert response.unmatched_symbols == ["BOGUS"]
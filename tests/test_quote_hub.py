@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tradierpy.quote_hub import QuoteHub
+
+
+def quote(symbol: str, seq: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(symbol=symbol, seq=seq)
+
+
+def drain(subscription) -> list[tuple[str, int]]:
+    quotes = []
+    while (q := subscription.get_nowait()) is not None:
+        quotes.append((q.symbol, q.seq))
+    return quotes
+
+
+def test_pending_quotes_are_conflated_per_symbol():
+    hub = QuoteHub()
+    subscription = hub.subscribe()
+    hub.publish_many([quote("SPY", 1), quote("QQQ", 1), quote("SPY", 2)])
+    assert subscription.stats.pending == 2
+    # The newer SPY quote keeps the older one's place in line
+    assert drain(subscription) == [("SPY", 2), ("QQQ", 1)]
+    stats = subscription.stats
+    assert (stats.delivered, stats.conflated, stats.dropped) == (2, 1, 0)
+
+
+def test_full_queue_drops_the_oldest_symbol():
+    hub = QuoteHub()
+    subscription = hub.subscribe(maxsize=2, name="slow")
+    hub.publish_many([quote("A"), quote("B"), quote("A", 1), quote("C")])
+    # A replaced in place is still the oldest
+    assert drain(subscription) == [("B", 0), ("C", 0)]
+    assert hub.stats()["slow"].dropped == 1
+    assert hub.stats()["slow"].conflated == 1
+
+
+def test_symbol_filters_ignore_case():
+    hub = QuoteHub()
+    spy = hub.subscribe(["spy"])
+    everything = hub.subscribe()
+    hub.publish_many([quote("SPY", 1), quote("QQQ"), quote("spy", 2)])
+    assert drain(spy) == [("spy", 2)]
+    assert spy.stats.conflated == 1
+    assert drain(everything) == [("spy", 2), ("QQQ", 0)]
+
+
+def test_close_stops_delivery_and_drains_pending():
+    hub = QuoteHub()
+    subscription = hub.subscribe(["SPY", "QQQ"])
+    hub.publish_many([quote("SPY"), quote("QQQ")])
+    subscription.close()
+    hub.publish(quote("SPY", 1))
+    assert hub.subscriptions == []
+    assert hub.stats() == {}
+
+    async def main():
+        return [(q.symbol, q.seq) async for q in subscription]
+
+    assert asyncio.run(main()) == [("SPY", 0), ("QQQ", 0)]
+
+
+def test_close_wakes_waiting_readers():
+    async def main():
+        hub = QuoteHub()
+        subscriptions = [hub.subscribe(), hub.subscribe(["SPY"])]
+        readers = [asyncio.create_task(s.get()) for s in subscriptions]
+        await asyncio.sleep(0)
+        hub.publish(quote("QQQ"))
+        assert (await readers[0]).symbol == "QQQ"
+        hub.close()
+        with pytest.raises(StopAsyncIteration):
+            await readers[1]
+
+    asyncio.run(main())
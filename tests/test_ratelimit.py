@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from httpx import Request, Response
+
+from benchmarks.payloads import quotes_payload
+from tradierpy.ratelimit import EndpointFamily
+
+ALLOWED = 5
+WINDOW = 0.1
+
+
+class RateLimitedServer:
+    """Answers with X-Ratelimit headers for a fixed window, recording the most
+    requests it saw in any one window."""
+
+    def __init__(self):
+        self.expiry = 0
+        self.used = 0
+        self.most_used = 0
+        self.requests = 0
+
+    async def __call__(self, request: Request) -> Response:
+        # Whole milliseconds, as in the headers
+        now = int(time.time() * 1000)
+        if now >= self.expiry:
+            self.expiry, self.used = now + int(WINDOW * 1000), 0
+        self.used += 1
+        self.requests += 1
+        self.most_used = max(self.most_used, self.used)
+        await asyncio.sleep(0.005)
+        headers = {
+            "X-Ratelimit-Allowed": str(ALLOWED),
+            "X-Ratelimit-Used": str(self.used),
+            "X-Ratelimit-Available": str(max(ALLOWED - self.used, 0)),
+            "X-Ratelimit-Expiry": str(self.expiry),
+        }
+        if request.url.path.endswith("/positions"):
+            return Response(200, json={"positions": "null"}, headers=headers)
+        return Response(200, json=quotes_payload(["SPY"]), headers=headers)
+
+
+def test_cold_burst_stays_within_budget(mock_client):
+    server = RateLimitedServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            await asyncio.gather(*(tradier.get_quotes("SPY") for _ in range(30)))
+
+    asyncio.run(main())
+    assert server.requests == 30
+    assert server.most_used <= ALLOWED
+
+
+def test_budget_unknown_sends_one_probe(mock_client):
+    server = RateLimitedServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            tasks = [asyncio.create_task(tradier.get_quotes("SPY")) for _ in range(10)]
+            # Only the probe gets out before the first response arrives
+            await asyncio.sleep(0.002)
+            probed = server.requests
+            await asyncio.gather(*tasks)
+            return probed
+
+    assert asyncio.run(main()) == 1
+
+
+def test_get_positions_is_rate_limited(mock_client):
+    server = RateLimitedServer()
+
+    async def main():
+        async with mock_client(server) as tradier:
+            await tradier.get_positions()
+            return tradier.rate_limits
+
+    budgets = asyncio.run(main())
+    assert budgets[EndpointFamily.ACCOUNT].used == 1
+    assert EndpointFamily.MARKET_DATA not in budgets
+
+
+def test_no_headers_keeps_concurrency(mock_client):
+    in_flight = most_in_flight = requests = 0
+
+    async def handler(request: Request) -> Response:
+        nonlocal in_flight, most_in_flight, requests
+        in_flight += 1
+        requests += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(200, json=quotes_payload(["SPY"]))
+
+    async def main():
+        async with mock_client(handler) as tradier:
+            for _ in range(2):
+                await asyncio.gather(*(tradier.get_quotes("SPY") for _ in range(10)))
+            return tradier.rate_limits
+
+    assert asyncio.run(main()) == {}
+    assert requests == 20
+    # Only the first burst waits on a probe
+    assert most_in_flight == 10
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tradierpy.quote_columns import TIMESTAMP_FIELDS
+from tradierpy.tick_buffer import TickBuffer
+
+START = 1727447400000
+
+
+def snapshot(symbols, time, bid, ask, last, volume) -> dict:
+    """Quote columns as from `quote_columns`, one value per symbol."""
+    n = len(symbols)
+    columns = {
+        "symbol": np.array(symbols),
+        "bid": np.full(n, bid, dtype=np.float64),
+        "ask": np.full(n, ask, dtype=np.float64),
+        "last": np.full(n, last, dtype=np.float64),
+        "volume": np.broadcast_to(np.asarray(volume, dtype=np.int64), n).copy(),
+        "bidsize": np.full(n, 1, dtype=np.int64),
+        "asksize": np.full(n, 2, dtype=np.int64),
+    }
+    for name in TIMESTAMP_FIELDS:
+        columns[name] = np.full(n, time, dtype=np.int64)
+    return columns
+
+
+def test_ring_keeps_the_newest_ticks_oldest_first():
+    ticks = TickBuffer(capacity=4)
+    for i in range(6):
+        ticks.add_columns(snapshot(["SPY"], START + i * 1000, i, i + 1, i, 0))
+    assert ticks.ticks("SPY")["bid"].tolist() == [2, 3, 4, 5]
+    assert ticks.ticks("SPY", n=2)["bid"].tolist() == [4, 5]
+    assert ticks.ticks("SPY", n=10)["bid"].tolist() == [2, 3, 4, 5]
+    assert ticks.mids("SPY", n=1).tolist() == [5.5]
+
+
+def test_seconds_are_relative_to_the_newest_tick():
+    ticks = TickBuffer(capacity=8)
+    for offset in (0, 1000, 2500, 3000):
+        ticks.add_columns(snapshot(["SPY"], START + offset, 1, 2, 1, 0))
+    window = ticks.ticks("SPY", seconds=1)["time"] - START
+    assert window.tolist() == [2500, 3000]
+    assert len(ticks.ticks("SPY", n=1, seconds=10)["time"]) == 1
+
+
+def test_sizes_and_vwap_come_from_volume_increases():
+    ticks = TickBuffer()
+    for last, volume in ((100, 1000), (101, 1100), (102, 1100), (103, 1400)):
+        ticks.add_columns(snapshot(["SPY"], START, 1, 2, last, volume))
+    assert ticks.ticks("SPY")["size"].tolist() == [0, 100, 0, 300]
+    assert ticks.vwap("SPY") == pytest.approx((101 * 100 + 103 * 300) / 400)
+    assert ticks.vwap("SPY", n=2) == 103
+    ticks.add_columns(snapshot(["QQQ"], START, 1, 2, 50, 500))
+    assert np.isnan(ticks.vwap("QQQ"))
+
+
+def test_latest_mids_align_with_the_requested_symbols():
+    ticks = TickBuffer()
+    ticks.add_columns(snapshot(["SPY", "QQQ"], START, 1, 3, 2, 0))
+    ticks.add_columns(snapshot(["QQQ"], START + 1000, 4, 6, 5, 0))
+    mids = ticks.latest_mids(["QQQ", "NOPE", "SPY"])
+    assert mids[[0, 2]].tolist() == [5, 2]
+    assert np.isnan(mids[1])
+    assert ticks.latest_mids().tolist() == [2, 5]
+
+
+def test_rows_grow_past_the_initial_symbols():
+    ticks = TickBuffer(capacity=4, symbols=2)
+    ticks.add_columns(snapshot(["A", "B"], START, 1, 2, 1, 10))
+    symbols = [f"S{i}" for i in range(5)]
+    ticks.add_columns(snapshot(["A", *symbols], START + 1000, 3, 4, 3, 30))
+    assert ticks.symbols == ["A", "B", *symbols]
+    assert ticks.ticks("A")["bid"].tolist() == [1, 3]
+    assert ticks.ticks("A")["size"].tolist() == [0, 20]
+    assert ticks.ticks("B")["bid"].tolist() == [1]
+    assert ticks.ticks("S4")["size"].tolist() == [0]
+
+
+def test_stream_events_carry_forward_the_other_side():
+    date = datetime.fromtimestamp(START / 1000, timezone.utc)
+    quote = SimpleNamespace(
+        type="quote",
+        symbol="SPY",
+        bid=1.0,
+        ask=2.0,
+        bidsz=3,
+        asksz=4,
+        biddate=date,
+        askdate=date,
+    )
+    trade = SimpleNamespace(
+        type="trade", symbol="SPY", price=1.5, size=100, cvol=1000, date=date
+    )
+    ticks = TickBuffer()
+    ticks.add_events([quote, trade, SimpleNamespace(type="summary")])
+    data = ticks.ticks("SPY")
+    assert data["bid"].tolist() == [1, 1]
+    assert np.isnan(data["last"][0]) and data["last"][1] == 1.5
+    assert data["size"].tolist() == [0, 100]
+    assert data["time"].tolist() == [START, START]
@@ -2,10 +2,19 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from pydantic import AliasPath, BaseModel, Field, PositiveInt, field_validator
+from pydantic import (
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PositiveInt,
+    field_validator,
+)
 
 
 class Position(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     cost_basis: Decimal
     date_acquired: datetime
     id: PositiveInt
@@ -14,6 +23,8 @@ class Position(BaseModel):
 
 
 class GetPositionsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     # Unconfirmed that no positions gives "positions": "null", but assuming it's like
     # the other endpoints.
     positions: list[Position] = Field(validation_alias=AliasPath("positions"))
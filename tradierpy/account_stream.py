@@ -0,0 +1,223 @@
+"""Tradier's account events stream over a websocket, for order status updates without
+polling `get_order`. Requires the `stream` extra.
+
+https://documentation.tradier.com/brokerage-api/streaming/wss-account-websocket
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Optional, Self, Union
+
+from httpx import HTTPError
+from pydantic import BaseModel, ConfigDict, Field
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, WebSocketException
+
+from tradierpy.client import type_adapter
+from tradierpy.order import OrderResponse, OrderStatus
+
+if TYPE_CHECKING:
+    from tradierpy.client import TradierClient
+
+ACCOUNT_EVENTS_URL = "wss://ws.tradier.com/v1/accounts/events"
+
+# How far before the last received message to look for missed order updates, for
+# clock skew
+RECONCILE_MARGIN = timedelta(seconds=5)
+
+logger = logging.getLogger(__name__)
+
+
+# Order events come in like:
+# {
+#     "id": 2114304,
+#     "event": "order",
+#     "status": "filled",
+#     "type": "market",
+#     "price": 0.0,
+#     "stop_price": 0.0,
+#     "avg_fill_price": 1.15,
+#     "executed_quantity": 1.0,
+#     "last_fill_quantity": 1.0,
+#     "last_fill_price": 1.15,
+#     "remaining_quantity": 0.0,
+#     "transaction_date": "2019-08-27T18:09:15.843Z",
+#     "create_date": "2019-08-27T18:09:15.589Z",
+#     "account": "6YA05708"
+# }
+class OrderEvent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    event: Literal["order"]
+    id: int
+    status: OrderStatus
+    type: str
+    price: Optional[Decimal] = None
+    stop_price: Optional[Decimal] = None
+    avg_fill_price: Decimal
+    executed_quantity: int
+    last_fill_quantity: int
+    last_fill_price: Decimal
+    remaining_quantity: int
+    transaction_date: datetime
+    create_date: datetime
+    account: str
+    # Made up from get_orders after a reconnect rather than received
+    reconciled: bool = False
+
+    @classmethod
+    def from_order(cls, order: OrderResponse, account: str) -> Self:
+        return cls(
+            event="order",
+            id=order.id,
+            status=order.status,
+            type=order.type,
+            price=order.price,
+            stop_price=getattr(order, "stop_price", None),
+            avg_fill_price=order.avg_fill_price,
+            executed_quantity=order.exec_quantity,
+            last_fill_quantity=order.last_fill_quantity,
+            last_fill_price=order.last_fill_price,
+            remaining_quantity=order.remaining_quantity,
+            transaction_date=order.transaction_date,
+            create_date=order.create_date,
+            account=account,
+            reconciled=True,
+        )
+
+
+class HeartbeatEvent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    event: Literal["heartbeat"]
+    status: str
+
+
+AccountEvent = Annotated[
+    Union[OrderEvent, HeartbeatEvent], Field(discriminator="event")
+]
+
+
+def parse_account_events(message: str | bytes) -> list[AccountEvent]:
+    adapter = type_adapter(AccountEvent)
+    return [adapter.validate_json(line) for line in message.splitlines() if line]
+
+
+class AccountStream:
+    """Order events for the account as an async iterator, reconnecting whenever the
+    connection drops:
+
+        async with AccountStream(tradier) as stream:
+            async for event in stream:
+                if event.status in FINAL_STATUSES:
+                    ...
+
+    Reconnects back off from `reconnect_delay` up to `max_reconnect_delay` seconds.
+    Updates since the last message received before the drop (heartbeats included)
+    are recovered with one `get_orders` call after reconnecting, retried with the same
+    backoff, and yielded as events with `reconciled` set. Repeats of an order's last
+    status and fill quantity are skipped. Heartbeats are not yielded.
+    """
+
+    def __init__(
+        self,
+        client: "TradierClient",
+        *,
+        url: str = ACCOUNT_EVENTS_URL,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.client = client
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.reconnects = 0
+        self._websocket: Optional[ClientConnection] = None
+        self._closed = False
+        self._pending: deque[OrderEvent] = deque()
+        self._last_seen: dict[int, tuple[OrderStatus, int]] = {}
+        # Everything up to here has been delivered
+        self._last_message_at: Optional[datetime] = None
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def connect(self) -> None:
+        session = await self.client.create_account_session()
+        self._websocket = await connect(self.url, max_size=None)
+        await self._websocket.send(
+            json.dumps(
+                {
+                    "events": ["order"],
+                    "sessionid": session.session_id,
+                    "excludeAccounts": [],
+                }
+            )
+        )
+        self._last_message_at = datetime.now(timezone.utc)
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._websocket is not None:
+            await self._websocket.close()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> OrderEvent:
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            try:
+                message = await self._websocket.recv()
+            except ConnectionClosed:
+                if self._closed:
+                    raise StopAsyncIteration
+                await self._reconnect()
+                continue
+            self._last_message_at = datetime.now(timezone.utc)
+            for event in parse_account_events(message):
+                if isinstance(event, OrderEvent):
+                    self._push(event)
+        return self._pending.popleft()
+
+    def _push(self, event: OrderEvent) -> None:
+        seen = (event.status, event.executed_quantity)
+        if self._last_seen.get(event.id) != seen:
+            self._last_seen[event.id] = seen
+            self._pending.append(event)
+
+    async def _reconnect(self) -> None:
+        since = self._last_message_at - RECONCILE_MARGIN
+        await self._with_backoff(self.connect, "reconnect")
+        self.reconnects += 1
+
+        # Connected first so nothing is missed between the two
+        response = await self._with_backoff(
+            lambda: self.client.get_orders(since=since), "reconcile"
+        )
+        for order in sorted(response.orders, key=lambda o: o.transaction_date):
+            if order.transaction_date >= since:
+                self._push(OrderEvent.from_order(order, self.client.account_id))
+
+    async def _with_backoff[T](
+        self, attempt: Callable[[], Awaitable[T]], name: str
+    ) -> T:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                return await attempt()
+            # ValueError: Tradier answered with an error
+            except (OSError, HTTPError, ValueError, WebSocketException) as e:
+                logger.warning("account stream %s failed, retrying: %s", name, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
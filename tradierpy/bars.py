@@ -0,0 +1,198 @@
+"""Incremental OHLCV bars per symbol in NumPy arrays. Requires the `numpy` extra.
+
+Keeps the current bar (and the last few completed ones) up to date from polled
+quotes or stream trades, instead of re-downloading history to see the current bar.
+"""
+
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_columns import QuoteColumns, quote_columns
+from tradierpy.symbol_rows import SymbolRows, grow_rows
+
+# Bar lengths in seconds: 1s, 1m, 5m
+DEFAULT_INTERVALS = (1, 60, 300)
+
+BarColumns = dict[str, np.ndarray]
+
+
+class _Bars:
+    """Ring buffers of bars for one interval, one row per symbol."""
+
+    def __init__(self, interval: int, history: int, symbols: int):
+        self.interval_ms = interval * 1000
+        self.history = history
+        # Epoch milliseconds the bar starts at
+        self.start = np.zeros((symbols, history), dtype=np.int64)
+        self.open = np.zeros((symbols, history), dtype=np.float64)
+        self.high = np.zeros((symbols, history), dtype=np.float64)
+        self.low = np.zeros((symbols, history), dtype=np.float64)
+        self.close = np.zeros((symbols, history), dtype=np.float64)
+        self.volume = np.zeros((symbols, history), dtype=np.int64)
+        # Bars started per row, ever; the current one is at (count - 1) % history
+        self.count = np.zeros(symbols, dtype=np.int64)
+
+    @property
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "start": self.start,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
+
+    def update(self, row: int, time: int, price: float, size: int) -> None:
+        start = time - time % self.interval_ms
+        count = self.count[row]
+        slot = (count - 1) % self.history
+        # Updates older than the current bar are folded into it
+        if count and start <= self.start[row, slot]:
+            self.high[row, slot] = max(self.high[row, slot], price)
+            self.low[row, slot] = min(self.low[row, slot], price)
+            self.close[row, slot] = price
+            self.volume[row, slot] += size
+            return
+        slot = count % self.history
+        self.start[row, slot] = start
+        self.open[row, slot] = self.high[row, slot] = price
+        self.low[row, slot] = self.close[row, slot] = price
+        self.volume[row, slot] = size
+        self.count[row] = count + 1
+
+    def update_many(
+        self, rows: np.ndarray, time: np.ndarray, price: np.ndarray, size: np.ndarray
+    ) -> None:
+        """`update` for several rows at once; each row at most once."""
+        start = time - time % self.interval_ms
+        count = self.count[rows]
+        slot = (count - 1) % self.history
+        current = (count > 0) & (start <= self.start[rows, slot])
+
+        r, s, p = rows[current], slot[current], price[current]
+        self.high[r, s] = np.maximum(self.high[r, s], p)
+        self.low[r, s] = np.minimum(self.low[r, s], p)
+        self.close[r, s] = p
+        self.volume[r, s] += size[current]
+
+        new = ~current
+        r, s, p = rows[new], count[new] % self.history, price[new]
+        self.start[r, s] = start[new]
+        self.open[r, s] = self.high[r, s] = self.low[r, s] = self.close[r, s] = p
+        self.volume[r, s] = size[new]
+        self.count[r] += 1
+
+    def grow(self, symbols: int) -> None:
+        for name, array in self.arrays.items():
+            setattr(self, name, grow_rows(array, symbols))
+        self.count = grow_rows(self.count, symbols)
+
+
+class BarAggregator:
+    """Rolling OHLCV bars per symbol for each of `intervals` (seconds), keeping the
+    last `history` bars of each.
+
+    Feed it quote snapshots with `add_response`/`add_columns`: a snapshot is a trade
+    of the increase in the day's volume since the previous one, at `last` and
+    `trade_date`, and snapshots without new volume are skipped. Or feed it stream
+    trades with `add_event`, or anything else with `update`. Each update costs the
+    same however many bars there are.
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[int] = DEFAULT_INTERVALS,
+        history: int = 1024,
+        symbols: int = 64,
+    ):
+        self._rows = SymbolRows(symbols, self._grow)
+        self._bars = {
+            interval: _Bars(interval, history, symbols) for interval in intervals
+        }
+
+    @property
+    def intervals(self) -> list[int]:
+        return list(self._bars)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        return self._rows.volume.nbytes + sum(
+            a.nbytes
+            for bars in self._bars.values()
+            for a in (*bars.arrays.values(), bars.count)
+        )
+
+    def update(self, symbol: str, time: int, price: float, size: int) -> None:
+        """A trade of `size` at `price` and `time` (epoch milliseconds)."""
+        row = self._rows.row(symbol)
+        for bars in self._bars.values():
+            bars.update(row, time, price, size)
+
+    def add_event(self, event: Any) -> None:
+        """Add a `tradierpy.market_stream` trade event; other events are ignored."""
+        if event.type != "trade":
+            return
+        self.update(
+            event.symbol, int(event.date.timestamp() * 1000), event.price, event.size
+        )
+        self._rows.volume[self._rows[event.symbol]] = event.cvol
+
+    def add_events(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.add_event(event)
+
+    def add_response(self, response: GetQuotesResponse) -> None:
+        self.add_columns(quote_columns(response))
+
+    def add_columns(self, columns: QuoteColumns) -> None:
+        """Add quote snapshots from `tradierpy.quote_columns` columns, e.g. from
+        `TradierClient.get_quote_columns`. Symbols must be unique within a batch."""
+        rows = self._rows.rows(columns["symbol"])
+        size = self._rows.traded(rows, columns["volume"])
+        traded = (size > 0) & ~np.isnan(columns["last"])
+        if not traded.any():
+            return
+        rows = rows[traded]
+        time = columns["trade_date"][traded]
+        price = columns["last"][traded]
+        size = size[traded]
+        for bars in self._bars.values():
+            bars.update_many(rows, time, price, size)
+
+    def bars(self, symbol: str, interval: int, n: Optional[int] = None) -> BarColumns:
+        """The last `n` (default: all kept) `interval` bars for `symbol`, oldest
+        first and ending with the current one, one array per field."""
+        bars = self._bars[interval]
+        row = self._rows[symbol]
+        count = int(bars.count[row])
+        kept = min(count, bars.history)
+        n = kept if n is None else min(n, kept)
+        slots = (count - n + np.arange(n)) % bars.history
+        return {name: array[row, slots] for name, array in bars.arrays.items()}
+
+    def current(
+        self, interval: int, symbols: Optional[Iterable[str]] = None
+    ) -> BarColumns:
+        """The current `interval` bar of each of `symbols` (default: all with bars),
+        with a `symbol` column."""
+        bars = self._bars[interval]
+        if symbols is None:
+            symbols = self.symbols
+        symbols = [s for s in symbols if s in self._rows]
+        rows = np.array([self._rows[s] for s in symbols], dtype=np.intp)
+        rows = rows[bars.count[rows] > 0]
+        slots = (bars.count[rows] - 1) % bars.history
+        columns = {"symbol": np.array(self.symbols, dtype=np.str_)[rows]}
+        columns |= {name: array[rows, slots] for name, array in bars.arrays.items()}
+        return columns
+
+    def _grow(self, symbols: int) -> None:
+        for bars in self._bars.values():
+            bars.grow(symbols)
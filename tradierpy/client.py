@@ -1,31 +1,76 @@
+import asyncio
 import os
+import re
+import ssl
 import webbrowser
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import cache
 from json import JSONDecodeError
-from typing import Any, Callable, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Self,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
-from httpx import AsyncClient, Response, URL
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    Limits,
+    Response,
+    Timeout,
+    URL,
+    create_ssl_context,
+)
 from pydantic import (
+    AliasChoices,
     AliasPath,
     BaseModel,
+    ConfigDict,
     Field,
     TypeAdapter,
     ValidationError,
     field_validator,
 )
+from pydantic_core import from_json
 
 from tradierpy.account import GetPositionsResponse
+from tradierpy.float_quote import FloatGetQuotesResponse
 from tradierpy.option_symbols import GetOptionSymbolsResponse
+from tradierpy.option_symbols_cache import OptionSymbolsCache
 from tradierpy.order import (
     CancelOrderRequest,
     ModifyOrderRequest,
     PlaceOrderRequest,
     CancelOrderResponse,
     GetOrdersResponse,
+    LazyGetOrdersResponse,
     ModifyOrderResponse,
+    OrderStatus,
     PlaceOrderResponse,
 )
+from tradierpy.order_cache import FinalizedOrderCache
 from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_aggregator import QuoteAggregator
+from tradierpy.quote_cache import QuoteCache, UnmatchedSymbolCache
+from tradierpy.ratelimit import (
+    EndpointFamily,
+    RateLimitBudget,
+    RateLimiter,
+    endpoint_family,
+)
+from tradierpy.stream_session import StreamSession
+
+if TYPE_CHECKING:
+    # Optional numpy extra
+    from tradierpy.quote_columns import QuoteColumns
 
 
 class DownstreamErrorResponse(BaseModel):
@@ -46,6 +91,8 @@ class DownstreamErrorResponse(BaseModel):
     }
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     # I'm assuming this is going to be a string if there's ever only one
     errors: list[str] = Field(validation_alias=AliasPath("errors"))
 
@@ -67,6 +114,8 @@ class DownstreamErrorResponse(BaseModel):
 class ClientErrorResponse(BaseModel):
     """Returned with 4xx requests (we did something wrong)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     code: int
     message: str
 
@@ -78,6 +127,8 @@ class OrderAlreadyFinalized(BaseModel):
     Tradier returns 400's if try to modify/cancel an already finalized order, and
     instead of JSON it's just a text response. Woof."""
 
+    model_config = ConfigDict(defer_build=True)
+
     message: str
 
 
@@ -85,8 +136,86 @@ class OrderAlreadyFinalized(BaseModel):
 JsonErrorResponse = Union[DownstreamErrorResponse, ClientErrorResponse]
 
 
+# One pooled connection is shared by every call a client makes, so only the first
+# request to api.tradier.com pays for the TCP + TLS handshake.
+DEFAULT_LIMITS = Limits(
+    max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+# With HTTP/2 every concurrent request is multiplexed as a stream over one connection.
+DEFAULT_HTTP2_LIMITS = Limits(
+    max_connections=1, max_keepalive_connections=1, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = Timeout(10.0, connect=5.0)
+
+# Most orders the filtered orders endpoint returns per page
+ORDERS_PAGE_LIMIT = 10000
+
+OrdersPage = TypeVar("OrdersPage", GetOrdersResponse, LazyGetOrdersResponse)
+
+
 class TradierClient:
-    def __init__(self, account_id=None, access_token=None):
+    """Async client for the Tradier brokerage API.
+
+    Holds a single long-lived connection pool. Use it as an async context manager, or
+    call `aclose()` when done, to release the pooled connections:
+
+        async with TradierClient() as tradier:
+            quotes = await tradier.get_quotes("SPY")
+
+    Pass `http2=True` (requires the `http2` extra) to multiplex concurrent calls over
+    a single connection instead of spreading them over the HTTP/1.1 pool, optionally
+    capping in-flight requests with `max_concurrent_streams`.
+
+    Requests are paced against the X-Ratelimit headers Tradier returns, queueing
+    rather than failing once a family's budget is spent; see `rate_limits`. Pass
+    `rate_limit=False` to disable.
+
+    `get_quotes` calls with more than `quotes_batch_size` symbols are split into
+    batches fetched concurrently, at most `quotes_batch_concurrency` at a time.
+    Setting `quotes_aggregation_window` (seconds) instead merges concurrent
+    `get_quotes` calls made within that window into a single request. Pass a
+    `QuoteCache` as `quote_cache` to serve still-fresh quotes from memory and only
+    fetch the stale or missing symbols, and an `UnmatchedSymbolCache` as
+    `unmatched_symbol_cache` to stop re-sending symbols Tradier recently reported as
+    unmatched (they're still returned in `unmatched_symbols`).
+
+    Pass an `OptionSymbolsCache` as `option_symbols_cache` to persist
+    `get_option_symbols` results on disk across restarts.
+
+    `fast_json=True` validates responses straight from the raw bytes; see
+    `validate_json_response`. `float_quotes=True` parses quote prices as floats
+    (`tradierpy.float_quote`) rather than Decimals, which is considerably cheaper for
+    high-volume market data; order-related models always use Decimals.
+
+    Pass a `FinalizedOrderCache` as `finalized_order_cache` to have `get_order` serve
+    orders that already reached a final status without a request.
+
+    `transport` replaces httpx's network transport, e.g. with an `httpx.MockTransport`
+    in tests; `limits` and `http2` then don't apply.
+    """
+
+    def __init__(
+        self,
+        account_id=None,
+        access_token=None,
+        *,
+        base_url: str = "https://api.tradier.com/v1",
+        limits: Optional[Limits] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        max_concurrent_streams: Optional[int] = None,
+        rate_limit: bool = True,
+        quotes_batch_size: int = 500,
+        quotes_batch_concurrency: int = 4,
+        quotes_aggregation_window: Optional[float] = None,
+        quote_cache: Optional[QuoteCache] = None,
+        unmatched_symbol_cache: Optional[UnmatchedSymbolCache] = None,
+        option_symbols_cache: Optional[OptionSymbolsCache] = None,
+        fast_json: bool = False,
+        float_quotes: bool = False,
+        finalized_order_cache: Optional[FinalizedOrderCache] = None,
+        transport: Optional[AsyncBaseTransport] = None,
+    ):
         self.account_id = account_id or os.getenv("TRADIER_ACCOUNT_ID")
         self.__access_token = access_token or os.getenv("TRADIER_ACCESS_TOKEN")
 
@@ -99,93 +228,409 @@ class TradierClient:
             "Accept": "application/json",
             "Authorization": f"Bearer {self.__access_token}",
         }
-        self.base_url = "https://api.tradier.com/v1"
+        self.base_url = base_url
+        if limits is None:
+            limits = DEFAULT_HTTP2_LIMITS if http2 else DEFAULT_LIMITS
+        self._client = AsyncClient(
+            base_url=self.base_url,
+            headers=self.__headers,
+            limits=limits,
+            timeout=timeout,
+            verify=_ssl_context(),
+            # HTTP/2 is negotiated via TLS ALPN; plaintext (i.e. a local stand-in
+            # server) only works with prior knowledge, so don't offer HTTP/1.1 there.
+            http1=not (http2 and URL(self.base_url).scheme == "http"),
+            http2=http2,
+            transport=transport,
+        )
+        self._streams = (
+            None
+            if max_concurrent_streams is None
+            else asyncio.Semaphore(max_concurrent_streams)
+        )
+        self._rate_limiter = RateLimiter() if rate_limit else None
+        self.quotes_batch_size = quotes_batch_size
+        self.quotes_batch_concurrency = quotes_batch_concurrency
+        self._quote_aggregator = (
+            None
+            if quotes_aggregation_window is None
+            else QuoteAggregator(self._fetch_quotes, quotes_aggregation_window)
+        )
+        self.quote_cache = quote_cache
+        self.unmatched_symbol_cache = unmatched_symbol_cache
+        self._quotes_response_type = (
+            FloatGetQuotesResponse if float_quotes else GetQuotesResponse
+        )
+        self.option_symbols_cache = option_symbols_cache
+        self.finalized_order_cache = finalized_order_cache
         self.try_parse_positions_response = TradierClient.validate_json_response(
-            GetPositionsResponse
+            GetPositionsResponse, fast=fast_json
         )
         self.try_parse_option_symbols_response = TradierClient.validate_json_response(
-            GetOptionSymbolsResponse
+            GetOptionSymbolsResponse, fast=fast_json
         )
         self.try_parse_orders_response = TradierClient.validate_json_response(
-            GetOrdersResponse
+            GetOrdersResponse, fast=fast_json
+        )
+        self.try_parse_lazy_orders_response = TradierClient.validate_json_response(
+            LazyGetOrdersResponse, fast=fast_json
         )
         self.try_parse_quotes_response = TradierClient.validate_json_response(
-            GetQuotesResponse
+            self._quotes_response_type, fast=fast_json
+        )
+        self.try_parse_stream_session_response = TradierClient.validate_json_response(
+            StreamSession, fast=fast_json
         )
         self.try_parse_place_order_response = TradierClient.validate_json_response(
-            PlaceOrderResponse
+            PlaceOrderResponse, fast=fast_json
         )
         self.try_parse_modify_order_response = TradierClient.validate_json_response(
-            ModifyOrderResponse
+            ModifyOrderResponse, fast=fast_json
         )
         self.try_parse_cancel_order_response = TradierClient.validate_json_response(
-            CancelOrderResponse
+            CancelOrderResponse, fast=fast_json
         )
 
+    async def __aenter__(self) -> Self:
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool. The client cannot be reused after."""
+        await self._client.aclose()
+
+    @property
+    def rate_limits(self) -> dict[EndpointFamily, RateLimitBudget]:
+        """Remaining request budget per endpoint family, as of the latest responses."""
+        return {} if self._rate_limiter is None else self._rate_limiter.budgets
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Response:
+        if self._rate_limiter is None:
+            return await self._send(method, url, **kwargs)
+
+        family = endpoint_family(method, url)
+        await self._rate_limiter.acquire(family)
+        res = None
+        try:
+            res = await self._send(method, url, **kwargs)
+            return res
+        finally:
+            self._rate_limiter.release(family, None if res is None else res.headers)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Response:
+        if self._streams is None:
+            return await self._client.request(method, url, **kwargs)
+        async with self._streams:
+            return await self._client.request(method, url, **kwargs)
+
     async def get_positions(self) -> GetPositionsResponse:
-        async with AsyncClient() as client:
-            res = await client.get(
-                f"{self.base_url}/accounts/{self.account_id}/positions",
-                headers=self.__headers,
-            )
+        res = await self._request("GET", f"/accounts/{self.account_id}/positions")
 
-            return self.try_parse_positions_response(res)
+        return self.try_parse_positions_response(res)
 
     async def get_quotes(self, *symbols: str) -> GetQuotesResponse:
-        async with AsyncClient() as client:
-            res = await client.post(
-                f"{self.base_url}/markets/quotes",
-                headers=self.__headers,
-                data={"symbols": ",".join(symbols)},
+        if self.quote_cache is None and self.unmatched_symbol_cache is None:
+            return await self._get_quotes(symbols)
+
+        unmatched, missing = [], list(symbols)
+        if self.unmatched_symbol_cache is not None:
+            unmatched, missing = self.unmatched_symbol_cache.lookup(missing)
+        cached = []
+        if self.quote_cache is not None:
+            cached, missing = self.quote_cache.lookup(missing)
+
+        responses = [
+            self._quotes_response_type.model_construct(
+                quotes=cached, unmatched_symbols=unmatched
             )
+        ]
+        if missing:
+            fetched = await self._get_quotes(missing)
+            if self.quote_cache is not None:
+                self.quote_cache.store(fetched.quotes)
+            if self.unmatched_symbol_cache is not None:
+                self.unmatched_symbol_cache.store(fetched.unmatched_symbols)
+            responses.append(fetched)
+        return self._quotes_response_type.merge(responses).select(symbols)
+
+    async def _get_quotes(self, symbols: Sequence[str]) -> GetQuotesResponse:
+        if self._quote_aggregator is not None:
+            return await self._quote_aggregator.get_quotes(symbols)
+        return await self._fetch_quotes(symbols)
+
+    async def _fetch_quotes(self, symbols: Sequence[str]) -> GetQuotesResponse:
+        if len(symbols) <= self.quotes_batch_size:
+            return await self._get_quotes_batch(symbols)
+
+        # Full option chains can be thousands of symbols, which makes for one huge
+        # request body and response; fetch them in batches instead.
+        semaphore = asyncio.Semaphore(self.quotes_batch_concurrency)
+
+        async def fetch(batch: Sequence[str]) -> GetQuotesResponse:
+            async with semaphore:
+                return await self._get_quotes_batch(batch)
+
+        size = self.quotes_batch_size
+        return self._quotes_response_type.merge(
+            await asyncio.gather(
+                *(fetch(symbols[i : i + size]) for i in range(0, len(symbols), size))
+            )
+        )
 
-            return self.try_parse_quotes_response(res)
+    async def get_quote_columns(self, *symbols: str) -> "QuoteColumns":
+        """Quotes as NumPy columns (see `tradierpy.quote_columns`), built straight
+        from the response bytes. Requires the `numpy` extra.
+
+        Skips model validation and the quote caches entirely; large symbol lists are
+        still fetched in concurrent batches.
+        """
+        from tradierpy.quote_columns import (
+            concat_quote_columns,
+            quote_columns_from_json,
+        )
+
+        semaphore = asyncio.Semaphore(self.quotes_batch_concurrency)
+
+        async def fetch(batch: Sequence[str]) -> "QuoteColumns":
+            async with semaphore:
+                res = await self._request(
+                    "POST", "/markets/quotes", data={"symbols": ",".join(batch)}
+                )
+            return quote_columns_from_json(res.content)
+
+        size = self.quotes_batch_size
+        return concat_quote_columns(
+            await asyncio.gather(
+                *(fetch(symbols[i : i + size]) for i in range(0, len(symbols), size))
+            )
+        )
+
+    async def _get_quotes_batch(self, symbols: Sequence[str]) -> GetQuotesResponse:
+        res = await self._request(
+            "POST", "/markets/quotes", data={"symbols": ",".join(symbols)}
+        )
+
+        return self.try_parse_quotes_response(res)
 
     async def get_option_symbols(self, underlying: str) -> GetOptionSymbolsResponse:
-        async with AsyncClient() as client:
-            res = await client.get(
-                f"{self.base_url}/markets/options/lookup",
-                headers=self.__headers,
-                params={"underlying": underlying},
+        if self.option_symbols_cache is not None:
+            return await self.option_symbols_cache.get(
+                underlying, self._fetch_option_symbols
             )
+        return await self._fetch_option_symbols(underlying)
+
+    async def _fetch_option_symbols(self, underlying: str) -> GetOptionSymbolsResponse:
+        res = await self._request(
+            "GET", "/markets/options/lookup", params={"underlying": underlying}
+        )
 
-            return self.try_parse_option_symbols_response(res)
+        return self.try_parse_option_symbols_response(res)
+
+    async def create_market_session(self) -> StreamSession:
+        """Session for the market events stream; see `tradierpy.market_stream`."""
+        res = await self._request("POST", "/markets/events/session")
+
+        return self.try_parse_stream_session_response(res)
+
+    async def create_account_session(self) -> StreamSession:
+        """Session for the account events stream; see `tradierpy.account_stream`."""
+        res = await self._request("POST", "/accounts/events/session")
+
+        return self.try_parse_stream_session_response(res)
+
+    async def get_orders(
+        self,
+        since: Optional[datetime] = None,
+        *,
+        status: Optional[OrderStatus | Iterable[OrderStatus]] = None,
+        symbol: Optional[str] = None,
+        klass: Optional[Literal["equity", "option", "multileg"]] = None,
+    ) -> GetOrdersResponse:
+        """Orders from `since` on (all of them, across pages), or the recent ones
+        Tradier returns by default without it.
+
+        `status`, `symbol` and `klass` are filtered on Tradier's side, so e.g. polling
+        for open orders doesn't download the whole history.
+        """
+        return await self._all_orders(
+            self.try_parse_orders_response,
+            lambda pages: GetOrdersResponse.model_construct(
+                orders=[order for page in pages for order in page.orders]
+            ),
+            since,
+            order_filters(status, symbol, klass),
+        )
 
-    async def get_orders(self, since: Optional[datetime] = None) -> GetOrdersResponse:
-        # "Hidden" filtered api: https://documentation.tradier.com/brokerage-api/accounts/get-account-orders-filtered
-        params = {"includeTags": "true"}
-        if since is not None:
-            params["start"] = since.strftime("%Y-%m-%d")
-            params["limit"] = 10000
-            params["filter"] = "all"
-        async with AsyncClient() as client:
-            res = await client.get(
-                f"{self.base_url}/accounts/{self.account_id}/orders",
-                headers=self.__headers,
-                params=params,
+    async def get_orders_lazy(
+        self,
+        since: Optional[datetime] = None,
+        *,
+        status: Optional[OrderStatus | Iterable[OrderStatus]] = None,
+        symbol: Optional[str] = None,
+        klass: Optional[Literal["equity", "option", "multileg"]] = None,
+    ) -> LazyGetOrdersResponse:
+        """Like `get_orders`, but orders are only validated when accessed."""
+        return await self._all_orders(
+            self.try_parse_lazy_orders_response,
+            lambda pages: LazyGetOrdersResponse.model_construct(
+                raw_orders=[order for page in pages for order in page.raw_orders]
+            ),
+            since,
+            order_filters(status, symbol, klass),
+        )
+
+    async def _all_orders(
+        self,
+        parse: Callable[[Response], OrdersPage],
+        merge: Callable[[list[OrdersPage]], OrdersPage],
+        since: Optional[datetime],
+        filters: dict[str, str],
+    ) -> OrdersPage:
+        if since is None and not filters:
+            res = await self._request(
+                "GET", f"/accounts/{self.account_id}/orders", params=orders_params(None)
             )
+            return parse(res)
 
-            return self.try_parse_orders_response(res)
+        pages = [
+            page
+            async for page in self._order_pages(
+                parse, since, None, ORDERS_PAGE_LIMIT, filters
+            )
+        ]
+        if len(pages) == 1:
+            return pages[0]
+        return merge(pages)
+
+    async def iter_orders(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        *,
+        page_size: int = 1000,
+        window: Optional[timedelta] = None,
+        concurrency: int = 4,
+        status: Optional[OrderStatus | Iterable[OrderStatus]] = None,
+        symbol: Optional[str] = None,
+        klass: Optional[Literal["equity", "option", "multileg"]] = None,
+    ) -> AsyncIterator[GetOrdersResponse]:
+        """Orders from `since` through `until` (default: no end), one validated page
+        of at most `page_size` orders at a time.
+
+        With `window`, the range is split into date windows of that length (`until`
+        defaults to today), each paged through concurrently with at most `concurrency`
+        requests in flight. Pages then arrive in no particular order. Either way only a
+        few pages are held in memory at once.
+
+        `status`, `symbol` and `klass` filter on Tradier's side as in `get_orders`.
+        """
+        filters = order_filters(status, symbol, klass)
+        if window is None:
+            async for page in self._order_pages(
+                self.try_parse_orders_response, since, until, page_size, filters
+            ):
+                yield page
+            return
+
+        first, last = since.date(), (until or datetime.now()).date()
+        days = timedelta(days=max(window.days, 1))
+        windows = []
+        while first <= last:
+            windows.append((first, min(first + days - timedelta(days=1), last)))
+            first += days
+
+        semaphore = asyncio.Semaphore(concurrency)
+        pages: asyncio.Queue[GetOrdersResponse] = asyncio.Queue(concurrency)
+
+        async def fetch(start: date, end: date) -> None:
+            async for page in self._order_pages(
+                self.try_parse_orders_response,
+                start,
+                end,
+                page_size,
+                filters,
+                semaphore,
+            ):
+                await pages.put(page)
+
+        tasks = {asyncio.create_task(fetch(*w)) for w in windows}
+        get = None
+        try:
+            while tasks or not pages.empty():
+                get = asyncio.ensure_future(pages.get())
+                done, _ = await asyncio.wait(
+                    (get, *tasks), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done - {get}:
+                    tasks.remove(task)
+                    # Raises the window's error, if any
+                    task.result()
+                if get in done:
+                    yield get.result()
+                else:
+                    get.cancel()
+        finally:
+            if get is not None:
+                get.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def _order_pages(
+        self,
+        parse: Callable[[Response], OrdersPage],
+        start: Optional[date],
+        end: Optional[date],
+        limit: int,
+        filters: dict[str, str],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[OrdersPage]:
+        # Tradier doesn't say how many pages there are; a short page is the last one
+        page = 1
+        while True:
+            params = orders_params(start, end, page, limit, filters)
+            if semaphore is None:
+                res = await self._request(
+                    "GET", f"/accounts/{self.account_id}/orders", params=params
+                )
+            else:
+                async with semaphore:
+                    res = await self._request(
+                        "GET", f"/accounts/{self.account_id}/orders", params=params
+                    )
+            response = parse(res)
+            yield response
+            if len(response.orders) < limit:
+                return
+            page += 1
 
     async def get_order(self, order_id: int) -> GetOrdersResponse:
-        async with AsyncClient() as client:
-            res = await client.get(
-                f"{self.base_url}/accounts/{self.account_id}/orders/{order_id}",
-                headers=self.__headers,
-                params={"includeTags": "true"},
-            )
+        if (
+            self.finalized_order_cache is not None
+            and (order := self.finalized_order_cache.get(order_id)) is not None
+        ):
+            return GetOrdersResponse.model_construct(orders=[order])
+
+        res = await self._request(
+            "GET",
+            f"/accounts/{self.account_id}/orders/{order_id}",
+            params={"includeTags": "true"},
+        )
 
-            return self.try_parse_orders_response(res)
+        response = self.try_parse_orders_response(res)
+        if self.finalized_order_cache is not None:
+            for order in response.orders:
+                self.finalized_order_cache.put(order)
+        return response
 
     async def place_order(self, order: PlaceOrderRequest) -> PlaceOrderResponse:
-        async with AsyncClient() as client:
-            res = await client.post(
-                f"{self.base_url}/accounts/{self.account_id}/orders",
-                headers=self.__headers,
-                data=order.model_dump(),
-            )
+        res = await self._request(
+            "POST", f"/accounts/{self.account_id}/orders", data=order.model_dump()
+        )
 
-            return self.try_parse_place_order_response(res)
+        return self.try_parse_place_order_response(res)
 
     async def stage_order(self, order: PlaceOrderRequest) -> bool:
         return webbrowser.open(
@@ -195,64 +640,171 @@ class TradierClient:
     async def modify_order(
         self, order: ModifyOrderRequest
     ) -> Union[ModifyOrderResponse, OrderAlreadyFinalized]:
-        async with AsyncClient() as client:
-            res = await client.put(
-                f"{self.base_url}/accounts/{self.account_id}/orders/{order.order_id}",
-                headers=self.__headers,
-                data=order.model_dump(),
-            )
+        res = await self._request(
+            "PUT",
+            f"/accounts/{self.account_id}/orders/{order.order_id}",
+            data=order.model_dump(),
+        )
 
-            # Maybe shouldn't be returning an "error" here but throwing if we can't
-            # validate the JSON? Counter-argument is this state is something the client
-            # likely wants to handle as unexceptional (I tried to modify, but it was
-            # already filled or canceled).
-            if res.status_code == 400:
-                return OrderAlreadyFinalized(message=res.text)
+        # Maybe shouldn't be returning an "error" here but throwing if we can't
+        # validate the JSON? Counter-argument is this state is something the client
+        # likely wants to handle as unexceptional (I tried to modify, but it was
+        # already filled or canceled).
+        if res.status_code == 400:
+            return OrderAlreadyFinalized(message=res.text)
 
-            return self.try_parse_modify_order_response(res)
+        return self.try_parse_modify_order_response(res)
 
     async def cancel_order(
         self, order: CancelOrderRequest
     ) -> Union[CancelOrderResponse, OrderAlreadyFinalized]:
-        async with AsyncClient() as client:
-            res = await client.delete(
-                f"{self.base_url}/accounts/{self.account_id}/orders/{order.order_id}",
-                headers=self.__headers,
-            )
+        res = await self._request(
+            "DELETE", f"/accounts/{self.account_id}/orders/{order.order_id}"
+        )
 
-            # Maybe shouldn't be returning an "error" here but throwing if we can't
-            # validate the JSON? Counter-argument is this state is something the client
-            # likely wants to handle as unexceptional (I tried to cancel, but it was
-            # already filled).
-            if res.status_code == 400:
-                return OrderAlreadyFinalized(message=res.text)
+        # Maybe shouldn't be returning an "error" here but throwing if we can't
+        # validate the JSON? Counter-argument is this state is something the client
+        # likely wants to handle as unexceptional (I tried to cancel, but it was
+        # already filled).
+        if res.status_code == 400:
+            return OrderAlreadyFinalized(message=res.text)
 
-            return self.try_parse_cancel_order_response(res)
+        return self.try_parse_cancel_order_response(res)
 
     # Could maybe just make this an Either instead of throwing a value error of the
     # Tradier error
     @staticmethod
+    @cache
     def validate_json_response[T: BaseModel](
-        concrete_type: type[T],
+        concrete_type: type[T], fast: bool = False
     ) -> Callable[[Response], T]:
-        ta = TypeAdapter(Union[JsonErrorResponse, concrete_type])
+        """Build a parser of responses into `concrete_type`.
+
+        Rather than validating against a Union of the error responses and
+        `concrete_type` (which has pydantic try the error models first on every
+        response), the top-level keys pick exactly one of them to validate against.
+
+        With `fast`, a payload whose first key is the one `concrete_type` expects is
+        validated straight from the raw bytes by pydantic-core; anything else (i.e.
+        errors) is decoded once by pydantic-core's JSON parser and dispatched on its
+        keys. Noticeably quicker on big payloads (thousands of orders or quotes).
+
+        Parsers are shared by every client, and the schemas behind them are only
+        built when the first response is parsed.
+        """
+        payload_keys = _payload_keys(concrete_type)
+
+        def dispatch(data: Any) -> TypeAdapter:
+            if isinstance(data, dict):
+                if "errors" in data:
+                    return type_adapter(DownstreamErrorResponse)
+                if "code" in data and not payload_keys & data.keys():
+                    return type_adapter(ClientErrorResponse)
+            return type_adapter(concrete_type)
+
+        def validate(data: Any) -> T:
+            adapter = dispatch(data)
+            try:
+                err_or_t = adapter.validate_python(data)
+            except ValidationError:
+                raise ValueError(f"failed to validate json as {adapter._type} {data}")
+
+            if isinstance(err_or_t, JsonErrorResponse):
+                raise ValueError(err_or_t)
+            return err_or_t
 
         def f(res: Response) -> T:
             try:
-                # Could also do this as ta.validate_json(res.content)
-                # This would cause Pydantic to raise a ValidationError on the invalid
-                # JSON. I'm thinking it's preferable to leave that to the response class
-                # then validate what we know is a decoded Python structure.
-                if isinstance(
-                    err_or_t := ta.validate_python(res.json()), JsonErrorResponse
-                ):
-                    raise ValueError(err_or_t)
-                else:
-                    return err_or_t
-
+                # Leave invalid JSON to the response class, then validate what we know
+                # is a decoded Python structure.
+                data = res.json()
             except JSONDecodeError as e:
                 raise ValueError(f"failed to decode response as json {res}") from e
-            except ValidationError:
-                raise ValueError(f"failed to validate json as {ta._type} {res.json()}")
+            return validate(data)
+
+        def f_fast(res: Response) -> T:
+            if (m := _FIRST_KEY.match(res.content)) and m[1].decode() in payload_keys:
+                ta = type_adapter(concrete_type)
+                try:
+                    return ta.validate_json(res.content)
+                except ValidationError as e:
+                    if any(err["type"] == "json_invalid" for err in e.errors()):
+                        raise ValueError(
+                            f"failed to decode response as json {res}"
+                        ) from e
+                    raise ValueError(
+                        f"failed to validate json as {ta._type} {res.text}"
+                    )
 
-        return f
+            try:
+                data = from_json(res.content)
+            except ValueError as e:
+                raise ValueError(f"failed to decode response as json {res}") from e
+            return validate(data)
+
+        return f_fast if fast else f
+
+
+def order_filters(
+    status: Optional[OrderStatus | Iterable[OrderStatus]] = None,
+    symbol: Optional[str] = None,
+    klass: Optional[str] = None,
+) -> dict[str, str]:
+    filters = {}
+    if status is not None:
+        filters["status"] = ",".join([status] if isinstance(status, str) else status)
+    if symbol is not None:
+        filters["symbol"] = symbol
+    if klass is not None:
+        filters["class"] = klass
+    return filters
+
+
+def orders_params(
+    since: Optional[date],
+    until: Optional[date] = None,
+    page: int = 1,
+    limit: int = ORDERS_PAGE_LIMIT,
+    filters: Optional[dict[str, str]] = None,
+) -> dict[str, Any]:
+    # "Hidden" filtered api: https://documentation.tradier.com/brokerage-api/accounts/get-account-orders-filtered
+    params = {"includeTags": "true"}
+    if since is not None or filters:
+        if since is not None:
+            params["start"] = since.strftime("%Y-%m-%d")
+        if until is not None:
+            params["end"] = until.strftime("%Y-%m-%d")
+        params["page"] = page
+        params["limit"] = limit
+        params["filter"] = "all"
+        params.update(filters or {})
+    return params
+
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    # Loading the CA bundle is most of the cost of creating an AsyncClient, and the
+    # context can be shared by every client.
+    return create_ssl_context()
+
+
+@cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """One TypeAdapter per type, built on first use."""
+    return TypeAdapter(tp)
+
+
+# Cheap peek at the first key of a JSON object, without decoding the rest
+_FIRST_KEY = re.compile(rb'\s*\{\s*"([^"\\]*)"')
+
+
+def _payload_keys(model: type[BaseModel]) -> frozenset[str]:
+    """The top-level keys a response validated as `model` is read from."""
+    keys = set()
+    for name, field in model.model_fields.items():
+        aliases = field.validation_alias or field.alias or name
+        if isinstance(aliases, AliasChoices):
+            aliases = aliases.choices
+        for alias in aliases if isinstance(aliases, list) else [aliases]:
+            keys.add(alias.path[0] if isinstance(alias, AliasPath) else alias)
+    return frozenset(keys)
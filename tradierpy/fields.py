@@ -0,0 +1,36 @@
+from typing import Any, get_args
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+
+class OneOrMany:
+    """Validates a list field that Tradier sends as a bare object when it has exactly
+    one item (and, with `null`, as the literal string "null" when it has none).
+
+        quotes: Annotated[list[Quote], OneOrMany()]
+
+    Unlike a `mode="before"` field validator this needs no Python hook on the raw
+    input, so `validate_json` keeps the whole payload in pydantic-core.
+    """
+
+    def __init__(self, null: bool = False):
+        self.null = null
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        [item_type] = get_args(source)
+        choices = [
+            handler(source),
+            core_schema.no_info_after_validator_function(
+                lambda item: [item], handler.generate_schema(item_type)
+            ),
+        ]
+        if self.null:
+            choices.append(
+                core_schema.no_info_after_validator_function(
+                    lambda _: [], core_schema.literal_schema(["null"])
+                )
+            )
+        return core_schema.union_schema(choices, mode="left_to_right")
@@ -0,0 +1,85 @@
+"""Quote models with prices as floats rather than Decimals.
+
+Constructing Decimals is most of the cost of parsing quotes, which matters when
+polling thousands of option quotes at a time and doesn't when displaying or pricing
+orders. Same shape, discriminated union and response as `tradierpy.quote`; use with
+`TradierClient(float_quotes=True)`.
+"""
+
+from datetime import datetime
+from typing import Annotated, Literal, Optional, Union
+
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
+
+from tradierpy.fields import OneOrMany
+from tradierpy.quote import GetQuotesResponse, Greeks
+
+
+class FloatBaseQuote(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    symbol: str
+    description: str
+    exch: str
+    last: Optional[float]
+    change: Optional[float]
+    volume: int
+    open: Optional[float]
+    high: Optional[float]
+    low: Optional[float]
+    close: Optional[float]
+    bid: Optional[float]
+    ask: Optional[float]
+    change_percentage: Optional[float]
+    average_volume: int
+    last_volume: int
+    trade_date: datetime
+    prevclose: Optional[float]
+    week_52_high: float
+    week_52_low: float
+    bidsize: int
+    bidexch: Optional[str]
+    bid_date: datetime
+    asksize: int
+    askexch: Optional[str]
+    ask_date: datetime
+
+
+class FloatIndexQuote(FloatBaseQuote):
+    type: Literal["index"]
+    bidexch: None
+    askexch: None
+    root_symbols: Optional[str]
+
+
+class FloatStockQuote(FloatBaseQuote):
+    type: Literal["stock"]
+    root_symbols: Optional[str]
+
+
+class FloatETFQuote(FloatBaseQuote):
+    type: Literal["etf"]
+    root_symbols: Optional[str]
+
+
+class FloatOptionQuote(FloatBaseQuote):
+    type: Literal["option"]
+    open_interest: int
+    contract_size: int
+    expiration_date: datetime
+    expiration_type: Literal["standard", "quarterlys", "weeklys", "eom"]
+    option_type: Literal["put", "call"]
+    root_symbol: str
+    greeks: Optional[Greeks] = None
+
+
+FloatQuote = Annotated[
+    Union[FloatIndexQuote, FloatStockQuote, FloatETFQuote, FloatOptionQuote],
+    Field(..., discriminator="type"),
+]
+
+
+class FloatGetQuotesResponse(GetQuotesResponse):
+    quotes: Annotated[list[FloatQuote], OneOrMany()] = Field(
+        validation_alias=AliasPath("quotes", "quote"), default_factory=list
+    )
@@ -0,0 +1,175 @@
+"""Tradier's market events stream over a websocket. Requires the `stream` extra.
+
+https://documentation.tradier.com/brokerage-api/streaming/wss-market-websocket
+"""
+
+import json
+from collections import deque
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Iterable,
+    Literal,
+    Optional,
+    Self,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, Field
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosedOK
+
+from tradierpy.client import type_adapter
+
+if TYPE_CHECKING:
+    from tradierpy.client import TradierClient
+
+MARKET_EVENTS_URL = "wss://ws.tradier.com/v1/markets/events"
+
+
+# Prices are floats rather than Decimals for the same reason as tradierpy.float_quote:
+# a busy stream is thousands of events a second. Tradier sends some numbers as strings
+# and the dates as epoch milliseconds.
+class QuoteEvent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Literal["quote"]
+    symbol: str
+    bid: float
+    bidsz: int
+    bidexch: str
+    biddate: datetime
+    ask: float
+    asksz: int
+    askexch: str
+    askdate: datetime
+
+
+class TradeEvent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Literal["trade"]
+    symbol: str
+    exch: str
+    price: float
+    size: int
+    cvol: int
+    date: datetime
+    last: float
+
+
+class SummaryEvent(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    type: Literal["summary"]
+    symbol: str
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    prev_close: Optional[float] = Field(None, validation_alias="prevClose")
+    close: Optional[float] = None
+
+
+MarketEvent = Annotated[
+    Union[QuoteEvent, TradeEvent, SummaryEvent], Field(discriminator="type")
+]
+
+
+def parse_market_events(message: str | bytes) -> list[MarketEvent]:
+    """Events in one websocket message, which may hold several separated by newlines."""
+    adapter = type_adapter(MarketEvent)
+    return [adapter.validate_json(line) for line in message.splitlines() if line]
+
+
+class MarketStream:
+    """Quote, trade and summary events for a changing set of symbols, all over one
+    websocket connection:
+
+        async with MarketStream(tradier, ["SPY"]) as stream:
+            await stream.subscribe("QQQ")
+            async for event in stream:
+                ...
+
+    Symbols can be added and removed while iterating; Tradier takes the whole symbol
+    list again each time. Iteration stops when the server closes the stream cleanly.
+    """
+
+    def __init__(
+        self,
+        client: "TradierClient",
+        symbols: Iterable[str] = (),
+        *,
+        events: Iterable[Literal["quote", "trade", "summary"]] = (
+            "quote",
+            "trade",
+            "summary",
+        ),
+        url: str = MARKET_EVENTS_URL,
+    ):
+        self.client = client
+        self.events = list(events)
+        self.url = url
+        # Insertion-ordered set
+        self._symbols = dict.fromkeys(s.upper() for s in symbols)
+        self._session_id: Optional[str] = None
+        self._websocket: Optional[ClientConnection] = None
+        self._pending: deque[MarketEvent] = deque()
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._symbols)
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def connect(self) -> None:
+        session = await self.client.create_market_session()
+        self._session_id = session.session_id
+        self._websocket = await connect(self.url, max_size=None)
+        await self._send_subscription()
+
+    async def aclose(self) -> None:
+        if self._websocket is not None:
+            await self._websocket.close()
+
+    async def subscribe(self, *symbols: str) -> None:
+        self._symbols.update(dict.fromkeys(s.upper() for s in symbols))
+        await self._send_subscription()
+
+    async def unsubscribe(self, *symbols: str) -> None:
+        for symbol in symbols:
+            self._symbols.pop(symbol.upper(), None)
+        await self._send_subscription()
+
+    async def _send_subscription(self) -> None:
+        if self._websocket is None:
+            return
+        await self._websocket.send(
+            json.dumps(
+                {
+                    "symbols": self.symbols,
+                    "sessionid": self._session_id,
+                    "filter": self.events,
+                    "linebreak": True,
+                    "validOnly": True,
+                }
+            )
+        )
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> MarketEvent:
+        while not self._pending:
+            try:
+                message = await self._websocket.recv()
+            except ConnectionClosedOK:
+                raise StopAsyncIteration
+            self._pending.extend(parse_market_events(message))
+        return self._pending.popleft()
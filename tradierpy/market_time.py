@@ -0,0 +1,9 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+
+
+def trading_date() -> date:
+    """Today's date in the market's (New York) time zone."""
+    return datetime.now(MARKET_TZ).date()
@@ -0,0 +1,243 @@
+"""Columnar option chains parsed from OCC symbols. Requires the `numpy` extra."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Literal, Optional, Self
+
+import numpy as np
+
+from tradierpy.option_symbols import GetOptionSymbolsResponse
+
+# OCC symbols are the root (up to 6 chars) then a fixed-width 15 char suffix:
+# YYMMDD expiration, C or P, then the strike in thousandths as 8 digits.
+# e.g. SPY241018C00575000 is the SPY Oct 18 2024 575 call
+OCC_SUFFIX_LEN = 15
+
+
+def strike_thousandths(strike: Decimal | float | int) -> int:
+    return int(Decimal(str(strike)) * 1000)
+
+
+class OptionChainColumns:
+    """Option contracts as parallel NumPy arrays instead of a list of OCC strings.
+
+    - `expiry`: datetime64[D]
+    - `strike`: int32, in thousandths of a dollar (575.5 -> 575500)
+    - `is_call`: bool
+    - `root_code`: index into `roots`, the distinct (interned) root symbols
+
+    Row order is the order the symbols were given in.
+    """
+
+    def __init__(
+        self,
+        roots: tuple[str, ...],
+        root_code: np.ndarray,
+        expiry: np.ndarray,
+        is_call: np.ndarray,
+        strike: np.ndarray,
+    ):
+        self.roots = roots
+        self.root_code = root_code
+        self.expiry = expiry
+        self.is_call = is_call
+        self.strike = strike
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[str]) -> Self:
+        symbols = list(symbols)
+        roots: dict[str, int] = {}
+        root_code = np.fromiter(
+            (roots.setdefault(s[:-OCC_SUFFIX_LEN], len(roots)) for s in symbols),
+            dtype=np.uint16,
+            count=len(symbols),
+        )
+        # Parse every suffix at once as a (n, 15) matrix of ASCII bytes
+        suffixes = np.array(
+            [s[-OCC_SUFFIX_LEN:] for s in symbols], dtype=f"S{OCC_SUFFIX_LEN}"
+        )
+        chars = suffixes.view(np.uint8).reshape(-1, OCC_SUFFIX_LEN)
+        digits = chars.astype(np.int32) - ord("0")
+
+        def number(start: int, stop: int) -> np.ndarray:
+            places = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int32)
+            return digits[:, start:stop] @ places
+
+        years, months, days = number(0, 2) + 2000, number(2, 4), number(4, 6)
+        expiry = (
+            (years - 1970).astype("datetime64[Y]")
+            + (months - 1).astype("timedelta64[M]")
+        ).astype("datetime64[D]") + (days - 1).astype("timedelta64[D]")
+
+        return cls(
+            roots=tuple(roots),
+            root_code=root_code,
+            expiry=expiry,
+            is_call=chars[:, 6] == ord("C"),
+            strike=number(7, 15),
+        )
+
+    @classmethod
+    def from_response(cls, response: GetOptionSymbolsResponse) -> Self:
+        return cls.from_symbols(
+            option for symbols in response.symbols or [] for option in symbols.options
+        )
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            a.nbytes for a in (self.root_code, self.expiry, self.is_call, self.strike)
+        )
+
+    def take(self, rows: np.ndarray) -> Self:
+        """Subset by a boolean mask or array of row indices."""
+        return type(self)(
+            roots=self.roots,
+            root_code=self.root_code[rows],
+            expiry=self.expiry[rows],
+            is_call=self.is_call[rows],
+            strike=self.strike[rows],
+        )
+
+    def mask(
+        self,
+        expiry_from: Optional[date] = None,
+        expiry_to: Optional[date] = None,
+        strike_min: Optional[Decimal | float | int] = None,
+        strike_max: Optional[Decimal | float | int] = None,
+        option_type: Optional[Literal["put", "call"]] = None,
+        root: Optional[str] = None,
+    ) -> np.ndarray:
+        """Boolean mask of rows matching every given (inclusive) bound."""
+        mask = np.ones(len(self), dtype=bool)
+        if expiry_from is not None:
+            mask &= self.expiry >= np.datetime64(expiry_from, "D")
+        if expiry_to is not None:
+            mask &= self.expiry <= np.datetime64(expiry_to, "D")
+        if strike_min is not None:
+            mask &= self.strike >= strike_thousandths(strike_min)
+        if strike_max is not None:
+            mask &= self.strike <= strike_thousandths(strike_max)
+        if option_type is not None:
+            mask &= self.is_call == (option_type == "call")
+        if root is not None:
+            mask &= self.root_code == (
+                self.roots.index(root) if root in self.roots else -1
+            )
+        return mask
+
+    def filter(self, **bounds) -> Self:
+        """Subset to rows matching the bounds; see `mask` for the arguments."""
+        return self.take(self.mask(**bounds))
+
+    def symbols(self) -> list[str]:
+        """The rows as OCC symbols."""
+        return [
+            f"{self.roots[r]}{e:%y%m%d}{'C' if c else 'P'}{s:08d}"
+            for r, e, c, s in zip(
+                self.root_code.tolist(),
+                self.expiry.tolist(),
+                self.is_call.tolist(),
+                self.strike.tolist(),
+            )
+        ]
+
+
+class OptionChainIndex:
+    """Option contracts sorted by (expiry, type, strike) for logarithmic lookups.
+
+    Build one from `OptionChainColumns` and reuse it; the sort is the only linear
+    work. Lookups return OCC symbols ready to hand to `get_quotes`.
+
+    An index covers a single root, since e.g. "SPXW" and the AM-settled "SPX" list
+    the same strikes. When the columns hold several (as `get_option_symbols("SPX")`
+    returns), pick one with `root`; otherwise a `ValueError` is raised.
+    """
+
+    def __init__(self, columns: OptionChainColumns, root: Optional[str] = None):
+        if root is not None:
+            columns = columns.filter(root=root)
+        elif len(present := np.unique(columns.root_code)) > 1:
+            roots = ", ".join(columns.roots[code] for code in present.tolist())
+            raise ValueError(f"columns have several roots ({roots}); pass root=")
+        order = np.lexsort((columns.strike, columns.is_call, columns.expiry))
+        self.columns = columns.take(order)
+        # One sortable key per (expiry, type) segment: days since epoch * 2 + is_call
+        self._segment = self._segment_key(self.columns.expiry, self.columns.is_call)
+        self.expirations = np.unique(self.columns.expiry)
+
+    @staticmethod
+    def _segment_key(expiry, is_call):
+        return np.asarray(expiry, dtype="datetime64[D]").astype(np.int64) * 2 + is_call
+
+    def _bounds(self, expiry: date, option_type: Literal["put", "call"]) -> slice:
+        key = self._segment_key(np.datetime64(expiry, "D"), option_type == "call")
+        return slice(
+            int(np.searchsorted(self._segment, key, "left")),
+            int(np.searchsorted(self._segment, key, "right")),
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def expirations_between(self, start: date, end: date) -> list[date]:
+        """Distinct expirations in [start, end]."""
+        lo = np.searchsorted(self.expirations, np.datetime64(start, "D"), "left")
+        hi = np.searchsorted(self.expirations, np.datetime64(end, "D"), "right")
+        return self.expirations[lo:hi].tolist()
+
+    def _nearest_rows(self, bounds: slice, price: Decimal | float | int, n: int):
+        strikes = self.columns.strike[bounds]
+        target = strike_thousandths(price)
+        # Grow a window outwards from the insertion point, taking the closer side
+        hi = int(np.searchsorted(strikes, target))
+        lo = hi - 1
+        while hi - lo - 1 < n and (lo >= 0 or hi < len(strikes)):
+            if hi >= len(strikes) or (
+                lo >= 0 and target - strikes[lo] <= strikes[hi] - target
+            ):
+                lo -= 1
+            else:
+                hi += 1
+        return np.arange(bounds.start + lo + 1, bounds.start + hi)
+
+    def nearest_strikes(
+        self,
+        expiry: date,
+        price: Decimal | float | int,
+        n: int,
+        option_type: Literal["put", "call"],
+    ) -> list[str]:
+        """The (up to) `n` contracts with strikes closest to `price`, by strike."""
+        rows = self._nearest_rows(self._bounds(expiry, option_type), price, n)
+        return self.columns.take(rows).symbols()
+
+    def atm_straddle(
+        self, expiry: date, price: Decimal | float | int
+    ) -> Optional[tuple[str, str]]:
+        """The (call, put) pair at the listed strike closest to `price`, if any."""
+        calls, puts = self._bounds(expiry, "call"), self._bounds(expiry, "put")
+        call_strikes = self.columns.strike[calls]
+        put_strikes = self.columns.strike[puts]
+        if not (len(call_strikes) and len(put_strikes)):
+            return None
+
+        [call_row] = self._nearest_rows(calls, price, 1)
+        strike = self.columns.strike[call_row]
+        put_idx = int(np.searchsorted(put_strikes, strike))
+        if put_idx < len(put_strikes) and put_strikes[put_idx] == strike:
+            put_row = puts.start + put_idx
+        else:
+            # Rare: nearest call strike has no put, fall back to the common strikes
+            common = np.intersect1d(call_strikes, put_strikes)
+            if not len(common):
+                return None
+            strike = common[np.abs(common - strike_thousandths(price)).argmin()]
+            call_row = calls.start + int(np.searchsorted(call_strikes, strike))
+            put_row = puts.start + int(np.searchsorted(put_strikes, strike))
+
+        call, put = self.columns.take(np.array([call_row, put_row])).symbols()
+        return call, put
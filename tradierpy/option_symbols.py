@@ -1,15 +1,19 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # TODO: probably make a data file or package and put this in there with quotes
 class OptionSymbols(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     # This is randomly camel case
     rootSymbol: str
     options: list[str]
 
 
 class GetOptionSymbolsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     # If the underlying is not found, it's {"symbols": null}
     symbols: Optional[list[OptionSymbols]]
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import os
+from datetime import date
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from tradierpy.market_time import trading_date
+from tradierpy.option_symbols import GetOptionSymbolsResponse
+
+logger = logging.getLogger(__name__)
+
+
+class OptionSymbolsCache:
+    """On-disk cache of get_option_symbols results, one file per underlying and
+    trading date under `directory`.
+
+    The listed contracts only change once a day, so a cached list from today is
+    returned as-is. One from an earlier day is still returned immediately (no network
+    call on a cold start) while a refresh for today runs in the background. Concurrent
+    gets of an underlying share one fetch.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self._entries: dict[str, tuple[date, GetOptionSymbolsResponse]] = {}
+        self._refreshes: dict[str, asyncio.Task] = {}
+
+    async def get(
+        self,
+        underlying: str,
+        fetch: Callable[[str], Awaitable[GetOptionSymbolsResponse]],
+    ) -> GetOptionSymbolsResponse:
+        today = trading_date()
+        entry = self._entries.get(underlying) or self._load(underlying)
+        if entry is None:
+            # Shielded so one caller giving up doesn't cancel the others' fetch
+            return await asyncio.shield(self._start_refresh(underlying, fetch, today))
+
+        cached_date, response = entry
+        if cached_date < today:
+            self._start_refresh(underlying, fetch, today)
+        return response
+
+    def _start_refresh(
+        self,
+        underlying: str,
+        fetch: Callable[[str], Awaitable[GetOptionSymbolsResponse]],
+        today: date,
+    ) -> asyncio.Task:
+        if (task := self._refreshes.get(underlying)) is None:
+            task = asyncio.create_task(self._refresh(underlying, fetch, today))
+            self._refreshes[underlying] = task
+            task.add_done_callback(lambda t: self._refreshed(underlying, t))
+        return task
+
+    async def _refresh(
+        self,
+        underlying: str,
+        fetch: Callable[[str], Awaitable[GetOptionSymbolsResponse]],
+        today: date,
+    ) -> GetOptionSymbolsResponse:
+        response = await fetch(underlying)
+        self._entries[underlying] = (today, response)
+        self._save(underlying, today, response)
+        return response
+
+    def _refreshed(self, underlying: str, task: asyncio.Task) -> None:
+        del self._refreshes[underlying]
+        if not task.cancelled() and (e := task.exception()) is not None:
+            logger.warning("failed to refresh option symbols for %s: %s", underlying, e)
+
+    def _path(self, underlying: str, day: date) -> Path:
+        return self.directory / underlying / f"{day.isoformat()}.json"
+
+    def _load(self, underlying: str) -> Optional[tuple[date, GetOptionSymbolsResponse]]:
+        # File names are ISO dates, so the last one sorted is the latest
+        paths = sorted((self.directory / underlying).glob("*.json"))
+        if not paths:
+            return None
+        try:
+            entry = (
+                date.fromisoformat(paths[-1].stem),
+                GetOptionSymbolsResponse.model_validate_json(paths[-1].read_bytes()),
+            )
+        except ValueError:
+            # Corrupt or from an incompatible version; refetch
+            return None
+        self._entries[underlying] = entry
+        return entry
+
+    def _save(
+        self, underlying: str, day: date, response: GetOptionSymbolsResponse
+    ) -> None:
+        path = self._path(underlying, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash mid-write never leaves a truncated file
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(response.model_dump_json())
+        os.replace(tmp, path)
+        for old in path.parent.glob("*.json"):
+            if old != path:
+                old.unlink(missing_ok=True)
@@ -1,11 +1,25 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Annotated, Any, Callable, Literal, Optional, Self, Union
+from functools import cache, cached_property
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Self,
+    Sequence,
+    Union,
+    overload,
+)
 
 from pydantic import (
+    AliasChoices,
     AliasPath,
     BaseModel,
+    ConfigDict,
     Field,
     TypeAdapter,
     field_validator,
@@ -14,6 +28,8 @@ from pydantic import (
 )
 from pydantic_core.core_schema import SerializerFunctionWrapHandler, ValidationInfo
 
+from tradierpy.fields import OneOrMany
+
 
 class OrderStatus(str, Enum):
     OPEN = "open"
@@ -26,6 +42,18 @@ class OrderStatus(str, Enum):
     ERROR = "error"
 
 
+# Orders in these statuses will never change again
+FINAL_STATUSES = frozenset(
+    {
+        OrderStatus.FILLED,
+        OrderStatus.CANCELED,
+        OrderStatus.EXPIRED,
+        OrderStatus.REJECTED,
+        OrderStatus.ERROR,
+    }
+)
+
+
 # When you submit the order the key for stop price is "stop", but when the order details
 # are fetched, it's "stop_price". I bet there's a story there.
 def order_type_price_field_match[T: BaseModel](
@@ -57,6 +85,8 @@ def order_type_price_field_match[T: BaseModel](
 
 
 class BaseOrderResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     symbol: str
     quantity: int
@@ -146,25 +176,90 @@ OrderResponse = Annotated[
 
 
 class GetOrdersResponse(BaseModel):
-    # Orders actually live at orders.order, but because of the complex validation we
-    # need , we cannot do AliasPath("orders", "order") or we do not see the value of
-    # the root "orders" key and cannot detect if it was the literal string "null".
-    orders: list[OrderResponse] = Field(validation_alias=AliasPath("orders"))
+    model_config = ConfigDict(defer_build=True)
 
-    @field_validator("orders", mode="before")
-    @classmethod
-    def validate_orders(cls, value: Any) -> Any:
-        # Tradier uses {"orders": "null"} (literal string null) for no orders.
-        if value == "null":
-            return []
-        # Single orders are {"orders": {"order": { ... }} with a dict
-        orders = isinstance(value, dict) and value.get("order")
-        if not orders:
-            raise ValueError("orders must be a dict containing an 'order' key")
-        elif isinstance(orders, dict):
-            return [orders]
-        else:
-            return orders
+    # Orders live at orders.order, a dict for a single order. With no orders Tradier
+    # sends {"orders": "null"} (literal string null) instead, hence falling back to the
+    # root "orders" key, which must then be exactly "null".
+    orders: Annotated[list[OrderResponse], OneOrMany(null=True)] = Field(
+        validation_alias=AliasChoices(AliasPath("orders", "order"), "orders")
+    )
+
+
+class LazyOrders(Sequence[OrderResponse]):
+    """Orders kept as the raw dicts from Tradier, validated one at a time on access.
+
+    Length, slicing and `filter` work on the raw fields without validating anything;
+    indexing or iterating validates (once) just the orders touched.
+    """
+
+    def __init__(self, raw: list[dict[str, Any]]):
+        self.raw = raw
+        self._validated: dict[int, OrderResponse] = {}
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> OrderResponse: ...
+    @overload
+    def __getitem__(self, index: slice) -> "LazyOrders": ...
+    def __getitem__(self, index: int | slice) -> "OrderResponse | LazyOrders":
+        if isinstance(index, slice):
+            return LazyOrders(self.raw[index])
+        if index < 0:
+            index += len(self.raw)
+        if (order := self._validated.get(index)) is None:
+            if not 0 <= index < len(self.raw):
+                raise IndexError("order index out of range")
+            order = _order_type_adapter().validate_python(self.raw[index])
+            self._validated[index] = order
+        return order
+
+    def __repr__(self) -> str:
+        return f"LazyOrders({len(self)} orders, {len(self._validated)} validated)"
+
+    def filter(
+        self,
+        status: Optional[OrderStatus | Iterable[OrderStatus]] = None,
+        symbol: Optional[str] = None,
+        tag: Optional[str] = None,
+        klass: Optional[Literal["equity", "option", "multileg"]] = None,
+    ) -> "LazyOrders":
+        """Narrow by raw field values, without validating any orders."""
+        statuses = {status} if isinstance(status, str) else status and set(status)
+        return LazyOrders(
+            [
+                order
+                for order in self.raw
+                if (statuses is None or order.get("status") in statuses)
+                and (symbol is None or order.get("symbol") == symbol)
+                and (tag is None or order.get("tag") == tag)
+                and (klass is None or order.get("class") == klass)
+            ]
+        )
+
+
+@cache
+def _order_type_adapter() -> TypeAdapter:
+    return TypeAdapter(OrderResponse)
+
+
+class LazyGetOrdersResponse(BaseModel):
+    """GetOrdersResponse that only checks the envelope up front; see `LazyOrders`.
+
+    Worth it when fetching thousands of orders to look at a handful of them.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    raw_orders: Annotated[list[dict[str, Any]], OneOrMany(null=True)] = Field(
+        validation_alias=AliasChoices(AliasPath("orders", "order"), "orders")
+    )
+
+    @cached_property
+    def orders(self) -> LazyOrders:
+        return LazyOrders(self.raw_orders)
 
 
 # Responses to order interactions come in like:
@@ -175,23 +270,31 @@ class GetOrdersResponse(BaseModel):
 #     }
 # }
 class PlaceOrderResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(validation_alias=AliasPath("order", "id"))
     status: Literal["ok"] = Field(validation_alias=AliasPath("order", "status"))
     partner_id: str = Field(validation_alias=AliasPath("order", "partner_id"))
 
 
 class CancelOrderResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(validation_alias=AliasPath("order", "id"))
     status: Literal["ok"] = Field(validation_alias=AliasPath("order", "status"))
 
 
 class ModifyOrderResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(validation_alias=AliasPath("order", "id"))
     status: Literal["ok"] = Field(validation_alias=AliasPath("order", "status"))
     partner_id: str = Field(validation_alias=AliasPath("order", "partner_id"))
 
 
 class BasePlaceOrderRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     type: Literal["market", "limit", "stop", "stop_limit", "debit", "credit", "even"]
     duration: Literal["day", "pre", "post", "gtc"]
@@ -221,6 +324,8 @@ class OptionPlaceOrderRequest(BasePlaceOrderRequest):
 
 
 class PlaceMultilegOrderLeg(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     option_symbol: str
     side: Literal["buy_to_open", "buy_to_close", "sell_to_open", "sell_to_close"]
     quantity: str = Field(..., pattern=r"^\d+$")
@@ -283,10 +388,19 @@ PlaceOrderRequest = Annotated[
     Field(..., discriminator="klass"),
 ]
 
-TradierRequestPlaceOrderTypeAdapter = TypeAdapter(PlaceOrderRequest)
+
+@cache
+def __getattr__(name: str) -> Any:
+    # Built on first access rather than at import, so importing this module doesn't
+    # pay for building every place order schema.
+    if name == "TradierRequestPlaceOrderTypeAdapter":
+        return TypeAdapter(PlaceOrderRequest)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ModifyOrderRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     order_id: str
     type: Optional[
         Literal["market", "limit", "stop", "stop_limit", "debit", "credit", "even"]
@@ -297,4 +411,6 @@ class ModifyOrderRequest(BaseModel):
 
 
 class CancelOrderRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     order_id: str
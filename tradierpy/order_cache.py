@@ -0,0 +1,64 @@
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from tradierpy.order import FINAL_STATUSES, OrderResponse, _order_type_adapter
+
+
+class FinalizedOrderCache:
+    """Remembers orders once they reach a final status, since they can't change.
+
+    Keeps up to `max_entries` orders in memory (least recently used evicted). With a
+    `directory`, every finalized order is also written there as JSON, so it survives
+    restarts and evictions.
+    """
+
+    def __init__(
+        self, directory: Optional[str | os.PathLike] = None, max_entries: int = 10_000
+    ):
+        self.directory = None if directory is None else Path(directory)
+        self.max_entries = max_entries
+        self._orders: OrderedDict[int, OrderResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def get(self, order_id: int) -> Optional[OrderResponse]:
+        if (order := self._orders.get(order_id)) is not None:
+            self._orders.move_to_end(order_id)
+            return order
+        if self.directory is None:
+            return None
+
+        try:
+            order = _order_type_adapter().validate_json(
+                self._path(order_id).read_bytes()
+            )
+        except (FileNotFoundError, ValueError):
+            return None
+        self._remember(order)
+        return order
+
+    def put(self, order: OrderResponse) -> bool:
+        """Cache `order` if it's final. Returns whether it was."""
+        if order.status not in FINAL_STATUSES:
+            return False
+        if order.id not in self._orders and self.directory is not None:
+            path = self._path(order.id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            # Unset optional fields default to None but don't validate as None
+            tmp.write_text(order.model_dump_json(by_alias=True, exclude_none=True))
+            os.replace(tmp, path)
+        self._remember(order)
+        return True
+
+    def _remember(self, order: OrderResponse) -> None:
+        self._orders[order.id] = order
+        self._orders.move_to_end(order.id)
+        while len(self._orders) > self.max_entries:
+            self._orders.popitem(last=False)
+
+    def _path(self, order_id: int) -> Path:
+        return self.directory / f"{order_id}.json"
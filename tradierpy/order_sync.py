@@ -0,0 +1,87 @@
+import asyncio
+from datetime import date, datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from tradierpy.client import TradierClient
+from tradierpy.market_time import trading_date
+from tradierpy.order import FINAL_STATUSES, OrderResponse
+
+
+class OrderSyncDelta(BaseModel):
+    # Orders seen for the first time, whatever their status
+    new: list[OrderResponse] = []
+    # Known orders that changed but are still open, pending or partially filled
+    changed: list[OrderResponse] = []
+    # Known orders that reached a final status
+    finalized: list[OrderResponse] = []
+
+
+class OrderSynchronizer:
+    """Keeps a local store of orders by id, current as of the last `sync()`.
+
+    The first sync lists every order since `since` (default: today). Later syncs only
+    list orders from the trading date of the previous sync on, to discover new ones
+    (including any placed late that day), skipping without validation any order
+    that's already final or unchanged. Open orders from before then aren't in that
+    list, so they're re-checked individually with `get_order`. Orders in a final
+    status are never re-checked.
+    """
+
+    def __init__(self, client: TradierClient, since: Optional[datetime] = None):
+        self.client = client
+        self.since = since
+        self.orders: dict[int, OrderResponse] = {}
+        self._raw: dict[int, dict[str, Any]] = {}
+        # Trading date the previous sync started on
+        self._synced_date: Optional[date] = None
+
+    @property
+    def open_orders(self) -> list[OrderResponse]:
+        return [o for o in self.orders.values() if o.status not in FINAL_STATUSES]
+
+    async def sync(self) -> OrderSyncDelta:
+        delta = OrderSyncDelta()
+        today = trading_date()
+        if self._synced_date is not None:
+            window_start = datetime.combine(self._synced_date, datetime.min.time())
+        elif self.since is not None:
+            window_start = self.since
+        else:
+            window_start = datetime.combine(today, datetime.min.time())
+
+        listed = (await self.client.get_orders_lazy(since=window_start)).orders
+        seen = set()
+        for i, raw in enumerate(listed.raw):
+            order_id = raw.get("id")
+            seen.add(order_id)
+            known = self.orders.get(order_id)
+            if known is not None and (
+                known.status in FINAL_STATUSES or raw == self._raw.get(order_id)
+            ):
+                continue
+            self._record(listed[i], delta)
+            self._raw[order_id] = raw
+
+        # Open orders placed before the listed window (e.g. GTC from previous days)
+        stale = [o.id for o in self.open_orders if o.id not in seen]
+        for response in await asyncio.gather(
+            *(self.client.get_order(order_id) for order_id in stale)
+        ):
+            for order in response.orders:
+                if order != self.orders.get(order.id):
+                    self._record(order, delta)
+
+        self._synced_date = today
+        return delta
+
+    def _record(self, order: OrderResponse, delta: OrderSyncDelta) -> None:
+        known = self.orders.get(order.id)
+        self.orders[order.id] = order
+        if known is None:
+            delta.new.append(order)
+        elif order.status in FINAL_STATUSES:
+            delta.finalized.append(order)
+        else:
+            delta.changed.append(order)
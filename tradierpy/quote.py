@@ -1,11 +1,15 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, Literal, Union, Optional, Any
+from typing import Annotated, Iterable, Literal, Union, Optional, Self
 
-from pydantic import BaseModel, Field, field_validator, AliasPath
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
+
+from tradierpy.fields import OneOrMany
 
 
 class BaseQuote(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     description: str
     exch: str
@@ -51,6 +55,8 @@ class ETFQuote(BaseQuote):
 
 
 class Greeks(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     delta: float
     gamma: float
     theta: float
@@ -82,24 +88,32 @@ Quote = Annotated[
 
 
 class GetQuotesResponse(BaseModel):
-    quotes: list[Quote] = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    quotes: Annotated[list[Quote], OneOrMany()] = Field(
         validation_alias=AliasPath("quotes", "quote"), default_factory=list
     )
-    unmatched_symbols: list[str] = Field(
+    unmatched_symbols: Annotated[list[str], OneOrMany()] = Field(
         validation_alias=AliasPath("quotes", "unmatched_symbols", "symbol"),
         default_factory=list,
     )
 
-    @field_validator("quotes", mode="before")
-    @classmethod
-    def cast_quotes_to_list(cls, value: Any) -> Any:
-        if isinstance(value, dict):
-            value = [value]
-        return value
-
-    @field_validator("unmatched_symbols", mode="before")
     @classmethod
-    def cast_unmatched_symbols_to_list(cls, value: Any) -> Any:
-        if isinstance(value, str):
-            value = [value]
-        return value
+    def merge(cls, responses: Iterable[Self]) -> Self:
+        """Combine responses (e.g. for batches of one request) in the order given."""
+        quotes, unmatched_symbols = [], []
+        for response in responses:
+            quotes.extend(response.quotes)
+            unmatched_symbols.extend(response.unmatched_symbols)
+        # Everything has already been validated
+        return cls.model_construct(quotes=quotes, unmatched_symbols=unmatched_symbols)
+
+    def select(self, symbols: Iterable[str]) -> Self:
+        """Narrow to just `symbols`, in that order."""
+        symbols = [s.upper() for s in dict.fromkeys(symbols)]
+        by_symbol = {q.symbol.upper(): q for q in self.quotes}
+        unmatched = {s.upper() for s in self.unmatched_symbols}
+        return self.model_construct(
+            quotes=[by_symbol[s] for s in symbols if s in by_symbol],
+            unmatched_symbols=[s for s in symbols if s in unmatched],
+        )
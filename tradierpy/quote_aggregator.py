@@ -0,0 +1,75 @@
+import asyncio
+from typing import Awaitable, Callable, Optional, Sequence
+
+from tradierpy.quote import GetQuotesResponse
+
+
+class QuoteAggregator:
+    """Merges get_quotes calls made within `window` seconds of each other into one
+    request, then hands each caller back just the symbols it asked for.
+
+    The window starts with the first call after a flush, so a lone call waits at most
+    `window` seconds longer than it would have otherwise.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Sequence[str]], Awaitable[GetQuotesResponse]],
+        window: float,
+    ):
+        self._fetch = fetch
+        self.window = window
+        # Dict as an ordered set, so the merged request keeps first-asked order
+        self._symbols: dict[str, None] = {}
+        self._waiters: list[tuple[Sequence[str], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get_quotes(self, symbols: Sequence[str]) -> GetQuotesResponse:
+        waiter = asyncio.get_running_loop().create_future()
+        self._symbols.update(dict.fromkeys(symbols))
+        self._waiters.append((symbols, waiter))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return await waiter
+
+    async def _flush(self) -> None:
+        try:
+            await asyncio.sleep(self.window)
+        except asyncio.CancelledError:
+            _, waiters = self._take()
+            self._fail(waiters, None)
+            raise
+
+        symbols, waiters = self._take()
+        try:
+            response = await self._fetch(symbols)
+        except Exception as e:
+            self._fail(waiters, e)
+            return
+        except BaseException:
+            # Cancelled (e.g. at shutdown); don't leave the callers hanging
+            self._fail(waiters, None)
+            raise
+
+        for requested, waiter in waiters:
+            # Callers that gave up (were cancelled) are already done
+            if not waiter.done():
+                waiter.set_result(response.select(requested))
+
+    def _take(self) -> tuple[list[str], list[tuple[Sequence[str], asyncio.Future]]]:
+        symbols, waiters = list(self._symbols), self._waiters
+        self._symbols, self._waiters, self._flush_task = {}, [], None
+        return symbols, waiters
+
+    @staticmethod
+    def _fail(
+        waiters: list[tuple[Sequence[str], asyncio.Future]], error: Optional[Exception]
+    ) -> None:
+        """Raise `error` in every waiting caller, or cancel them without one."""
+        for _, waiter in waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.cancel()
+            else:
+                waiter.set_exception(error)
@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+from typing import Iterable, Mapping, Optional, get_args
+
+from pydantic import BaseModel
+
+from tradierpy.quote import ETFQuote, IndexQuote, OptionQuote, Quote, StockQuote
+
+DEFAULT_QUOTE_TTLS: dict[type[Quote], float] = {
+    StockQuote: 1.0,
+    ETFQuote: 1.0,
+    IndexQuote: 1.0,
+    OptionQuote: 1.0,
+}
+
+
+class QuoteCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class QuoteCache:
+    """Per-symbol cache of quotes, so overlapping symbol sets share entries.
+
+    Each quote is fresh for the TTL (seconds) of its type; past that it's treated as
+    missing. TTLs given for e.g. `StockQuote` apply equally to `FloatStockQuote`. At
+    most `max_entries` quotes are kept, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[type[Quote], float]] = None,
+        max_entries: int = 10_000,
+    ):
+        self.ttls = {**DEFAULT_QUOTE_TTLS, **(ttls or {})}
+        # Keyed on the "type" discriminator, shared by Decimal and float quote models
+        self._ttls = {
+            get_args(quote_type.model_fields["type"].annotation)[0]: ttl
+            for quote_type, ttl in self.ttls.items()
+        }
+        self.max_entries = max_entries
+        # symbol -> (expires at, quote), least recently used first
+        self._entries: OrderedDict[str, tuple[float, Quote]] = OrderedDict()
+        self._stats = QuoteCacheStats()
+
+    @property
+    def stats(self) -> QuoteCacheStats:
+        return self._stats.model_copy()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, symbols: Iterable[str]) -> tuple[list[Quote], list[str]]:
+        """Split `symbols` into fresh cached quotes and the symbols still to fetch."""
+        now = time.monotonic()
+        fresh, missing = [], []
+        for symbol in symbols:
+            entry = self._entries.get(symbol.upper())
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(symbol.upper())
+                fresh.append(entry[1])
+            else:
+                missing.append(symbol)
+        self._stats.hits += len(fresh)
+        self._stats.misses += len(missing)
+        return fresh, missing
+
+    def store(self, quotes: Iterable[Quote]) -> None:
+        now = time.monotonic()
+        for quote in quotes:
+            key = quote.symbol.upper()
+            self._entries[key] = (now + self._ttls[quote.type], quote)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class UnmatchedSymbolCache:
+    """Remembers symbols Tradier reported as unmatched (unknown, expired options) for
+    `ttl` seconds, so they can be answered locally instead of re-sent every poll.
+
+    At most `max_entries` symbols are kept, dropping the oldest first.
+    """
+
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 100_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # symbol -> expires at, oldest first
+        self._expiries: dict[str, float] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def lookup(self, symbols: Iterable[str]) -> tuple[list[str], list[str]]:
+        """Split `symbols` into known unmatched symbols and the rest."""
+        now = time.monotonic()
+        unmatched, rest = [], []
+        for symbol in symbols:
+            expires = self._expiries.get(symbol.upper())
+            if expires is not None and expires > now:
+                unmatched.append(symbol)
+            else:
+                rest.append(symbol)
+        self.hits += len(unmatched)
+        return unmatched, rest
+
+    def store(self, symbols: Iterable[str]) -> None:
+        expires = time.monotonic() + self.ttl
+        for symbol in symbols:
+            key = symbol.upper()
+            # Re-insert so the dict stays ordered by expiry
+            self._expiries.pop(key, None)
+            self._expiries[key] = expires
+        while len(self._expiries) > self.max_entries:
+            del self._expiries[next(iter(self._expiries))]
+
+    def discard(self, symbol: str) -> None:
+        self._expiries.pop(symbol.upper(), None)
+
+    def clear(self) -> None:
+        self._expiries.clear()
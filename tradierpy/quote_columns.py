@@ -0,0 +1,90 @@
+"""Columnar NumPy views of quotes. Requires the `numpy` extra.
+
+Analytics over thousands of quotes (mids, spreads, greek-weighted exposure) want one
+array per field, not a list of models. `quote_columns_from_json` goes straight from
+the raw response bytes to columns without instantiating a model per quote.
+"""
+
+from typing import Any, Iterable
+
+import numpy as np
+from pydantic_core import from_json
+
+from tradierpy.quote import GetQuotesResponse
+
+FLOAT_FIELDS = ("bid", "ask", "last")
+INT_FIELDS = ("volume", "bidsize", "asksize")
+# Epoch milliseconds, as Tradier sends them
+TIMESTAMP_FIELDS = ("trade_date", "bid_date", "ask_date")
+GREEKS_FIELDS = (
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "phi",
+    "bid_iv",
+    "mid_iv",
+    "ask_iv",
+    "smv_vol",
+)
+
+QuoteColumns = dict[str, np.ndarray]
+
+
+def _columns(symbols: list[str], fields: dict[str, list[Any]]) -> QuoteColumns:
+    columns = {"symbol": np.array(symbols, dtype=np.str_)}
+    for name in FLOAT_FIELDS + GREEKS_FIELDS:
+        # None becomes NaN
+        columns[name] = np.array(fields[name], dtype=np.float64)
+    for name in INT_FIELDS + TIMESTAMP_FIELDS:
+        columns[name] = np.array(fields[name], dtype=np.int64)
+    return columns
+
+
+def quote_columns(response: GetQuotesResponse) -> QuoteColumns:
+    """Columns from already validated quotes. Greeks are NaN where absent."""
+    quotes = response.quotes
+    fields = {name: [getattr(q, name) for q in quotes] for name in FLOAT_FIELDS}
+    fields |= {name: [getattr(q, name) for q in quotes] for name in INT_FIELDS}
+    fields |= {
+        name: [int(getattr(q, name).timestamp() * 1000) for q in quotes]
+        for name in TIMESTAMP_FIELDS
+    }
+    greeks = [getattr(q, "greeks", None) for q in quotes]
+    fields |= {
+        name: [None if g is None else getattr(g, name) for g in greeks]
+        for name in GREEKS_FIELDS
+    }
+    return _columns([q.symbol for q in quotes], fields)
+
+
+def quote_columns_from_json(content: bytes | str) -> QuoteColumns:
+    """Columns straight from a raw /markets/quotes response body.
+
+    Only the fields that become columns are read; nothing else is validated. Raises
+    ValueError for anything but a quotes response (i.e. Tradier errors).
+    """
+    data = from_json(content)
+    if not isinstance(data, dict) or "quotes" not in data:
+        raise ValueError(f"not a quotes response {data}")
+    quotes = data["quotes"].get("quote", []) if isinstance(data["quotes"], dict) else []
+    if isinstance(quotes, dict):
+        quotes = [quotes]
+
+    names = FLOAT_FIELDS + INT_FIELDS + TIMESTAMP_FIELDS
+    fields = {name: [q[name] for q in quotes] for name in names}
+    greeks = [q.get("greeks") or {} for q in quotes]
+    fields |= {name: [g.get(name) for g in greeks] for name in GREEKS_FIELDS}
+    return _columns([q["symbol"] for q in quotes], fields)
+
+
+def concat_quote_columns(batches: Iterable[QuoteColumns]) -> QuoteColumns:
+    batches = list(batches)
+    if len(batches) == 1:
+        return batches[0]
+    if not batches:
+        return quote_columns(GetQuotesResponse())
+    return {
+        name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]
+    }
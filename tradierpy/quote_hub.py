@@ -0,0 +1,164 @@
+import asyncio
+from collections import OrderedDict
+from typing import Iterable, Optional, Self
+
+from pydantic import BaseModel
+
+from tradierpy.quote import GetQuotesResponse, Quote
+
+
+class SubscriptionStats(BaseModel):
+    delivered: int = 0
+    # Quotes replaced by a newer one for the same symbol before being read
+    conflated: int = 0
+    # Quotes discarded because the queue was full of other symbols
+    dropped: int = 0
+    pending: int = 0
+
+
+class QuoteSubscription:
+    """One subscriber's queue of pending quotes, at most one per symbol.
+
+    A new quote for a symbol that's still pending replaces it in place. A quote for
+    another symbol when `maxsize` symbols are already pending drops the oldest one.
+    Get one with `QuoteHub.subscribe`.
+    """
+
+    def __init__(
+        self,
+        hub: "QuoteHub",
+        symbols: Optional[frozenset[str]],
+        maxsize: int,
+        name: str,
+    ):
+        self.hub = hub
+        self.symbols = symbols
+        self.maxsize = maxsize
+        self.name = name
+        self.closed = False
+        self._pending: OrderedDict[str, Quote] = OrderedDict()
+        self._ready = asyncio.Event()
+        self._stats = SubscriptionStats()
+
+    @property
+    def stats(self) -> SubscriptionStats:
+        return self._stats.model_copy(update={"pending": len(self._pending)})
+
+    def put(self, quote: Quote) -> None:
+        symbol = quote.symbol.upper()
+        if symbol in self._pending:
+            self._stats.conflated += 1
+        elif len(self._pending) >= self.maxsize:
+            self._pending.popitem(last=False)
+            self._stats.dropped += 1
+        self._pending[symbol] = quote
+        self._ready.set()
+
+    def get_nowait(self) -> Optional[Quote]:
+        if not self._pending:
+            return None
+        self._stats.delivered += 1
+        return self._pending.popitem(last=False)[1]
+
+    async def get(self) -> Quote:
+        """The oldest pending quote, waiting for one if needed. Raises
+        `StopAsyncIteration` once closed and drained."""
+        while not self._pending:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def close(self) -> None:
+        """Stop receiving quotes; ones already pending can still be read."""
+        self.hub.unsubscribe(self)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Quote:
+        return await self.get()
+
+
+class QuoteHub:
+    """Fans quotes out to many asyncio subscribers without letting slow ones grow
+    memory or hold up the publisher.
+
+        hub = QuoteHub()
+        subscription = hub.subscribe(["SPY", "QQQ"], maxsize=100)
+        hub.publish_response(await tradier.get_quotes("SPY", "QQQ", "IWM"))
+        async for quote in subscription:
+            ...
+
+    Anything with a `symbol` works as a quote, including stream `QuoteEvent`s.
+    Symbols are matched case-insensitively.
+    Publishing never blocks: subscribers that fall behind see only the latest quote
+    per symbol (see `QuoteSubscription`).
+    """
+
+    def __init__(self):
+        self._by_symbol: dict[str, set[QuoteSubscription]] = {}
+        # Subscribed to every symbol
+        self._wildcard: set[QuoteSubscription] = set()
+        self._subscriptions: list[QuoteSubscription] = []
+        self._count = 0
+
+    def subscribe(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        *,
+        maxsize: int = 1000,
+        name: Optional[str] = None,
+    ) -> QuoteSubscription:
+        """Quotes for `symbols`, or all symbols when None. `name` labels it in
+        `stats()`."""
+        self._count += 1
+        name = name or f"subscription-{self._count}"
+        symbols = None if symbols is None else frozenset(s.upper() for s in symbols)
+        subscription = QuoteSubscription(self, symbols, maxsize, name)
+        if symbols is None:
+            self._wildcard.add(subscription)
+        else:
+            for symbol in symbols:
+                self._by_symbol.setdefault(symbol, set()).add(subscription)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        if subscription.closed:
+            return
+        subscription.closed = True
+        subscription._ready.set()
+        self._wildcard.discard(subscription)
+        for symbol in subscription.symbols or ():
+            subscribers = self._by_symbol[symbol]
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._by_symbol[symbol]
+        self._subscriptions.remove(subscription)
+
+    def publish(self, quote: Quote) -> None:
+        for subscription in self._by_symbol.get(quote.symbol.upper(), ()):
+            subscription.put(quote)
+        for subscription in self._wildcard:
+            subscription.put(quote)
+
+    def publish_many(self, quotes: Iterable[Quote]) -> None:
+        for quote in quotes:
+            self.publish(quote)
+
+    def publish_response(self, response: GetQuotesResponse) -> None:
+        self.publish_many(response.quotes)
+
+    @property
+    def subscriptions(self) -> list[QuoteSubscription]:
+        return list(self._subscriptions)
+
+    def stats(self) -> dict[str, SubscriptionStats]:
+        """Per open subscription, by name."""
+        return {s.name: s.stats for s in self._subscriptions}
+
+    def close(self) -> None:
+        for subscription in self.subscriptions:
+            subscription.close()
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Mapping, Optional
+
+from pydantic import BaseModel
+
+
+class EndpointFamily(str, Enum):
+    """Tradier rate limits are tracked separately for each of these.
+
+    https://documentation.tradier.com/brokerage-api/overview/rate-limiting
+    """
+
+    MARKET_DATA = "market_data"
+    TRADING = "trading"
+    ACCOUNT = "account"
+
+
+def endpoint_family(method: str, path: str) -> EndpointFamily:
+    if path.startswith("/markets"):
+        return EndpointFamily.MARKET_DATA
+    if "/orders" in path and method.upper() in ("POST", "PUT", "DELETE"):
+        return EndpointFamily.TRADING
+    return EndpointFamily.ACCOUNT
+
+
+class RateLimitBudget(BaseModel):
+    """Snapshot of the X-Ratelimit-* headers from the latest response in a family,
+    less any requests we've sent since that haven't been answered yet."""
+
+    allowed: int
+    used: int
+    available: int
+    expiry: datetime
+
+
+class RateLimiter:
+    """Paces requests against the budget Tradier reports in its X-Ratelimit headers.
+
+    Each family has its own FIFO queue. While a family's budget is unknown (before
+    its first response, or once a window has expired) a single probe request is sent
+    and the rest wait for its headers. Afterwards each request reserves one unit of
+    the budget, and once none are left requests wait in line until the window expires
+    instead of being sent and throttled. A family whose responses come back without
+    the headers isn't paced at all until some response has them again.
+    """
+
+    def __init__(self):
+        self._budgets: dict[EndpointFamily, RateLimitBudget] = {}
+        # Families whose responses don't carry the headers
+        self._unlimited: set[EndpointFamily] = set()
+        self._in_flight: dict[EndpointFamily, int] = {f: 0 for f in EndpointFamily}
+        self._queues = {f: asyncio.Lock() for f in EndpointFamily}
+        # Set whenever a response comes back, to wake a request waiting on a probe
+        self._responded = {f: asyncio.Event() for f in EndpointFamily}
+
+    @property
+    def budgets(self) -> dict[EndpointFamily, RateLimitBudget]:
+        return {f: b.model_copy() for f, b in self._budgets.items()}
+
+    async def acquire(self, family: EndpointFamily) -> None:
+        async with self._queues[family]:
+            while True:
+                budget = self._budgets.get(family)
+                if family in self._unlimited:
+                    break
+                if budget is None:
+                    if not self._in_flight[family]:
+                        # Probe; its response tells us the budget
+                        break
+                    self._responded[family].clear()
+                    await self._responded[family].wait()
+                    continue
+                wait = budget.expiry.timestamp() - time.time()
+                if wait <= 0:
+                    # Window rolled over; the next response will tell us the new one.
+                    del self._budgets[family]
+                elif budget.available > 0:
+                    budget.available -= 1
+                    budget.used += 1
+                    break
+                else:
+                    await asyncio.sleep(wait)
+            self._in_flight[family] += 1
+
+    def release(
+        self, family: EndpointFamily, headers: Optional[Mapping[str, str]]
+    ) -> None:
+        self._in_flight[family] -= 1
+        self._responded[family].set()
+        try:
+            allowed = int(headers["X-Ratelimit-Allowed"])
+            used = int(headers["X-Ratelimit-Used"])
+            available = int(headers["X-Ratelimit-Available"])
+            expiry = int(headers["X-Ratelimit-Expiry"])
+        except (TypeError, KeyError, ValueError):
+            # No (or garbled) headers. Without a budget to keep, the response answered
+            # the probe: this family isn't rate limited, so stop probing. A failed
+            # request (no response) leaves the next one to probe again.
+            if headers is not None and family not in self._budgets:
+                self._unlimited.add(family)
+            return
+        self._unlimited.discard(family)
+        self._budgets[family] = RateLimitBudget(
+            allowed=allowed,
+            used=used + self._in_flight[family],
+            available=max(available - self._in_flight[family], 0),
+            expiry=datetime.fromtimestamp(expiry / 1000),
+        )
@@ -0,0 +1,18 @@
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
+
+
+# Streaming sessions come in like:
+# {
+#     "stream": {
+#         "url": "https://stream.tradier.com/v1/markets/events",
+#         "sessionid": "c8638963-a6d4-4fb9-9bc6-e25fbd8c60c3"
+#     }
+# }
+class StreamSession(BaseModel):
+    """Session for one of Tradier's event streams. Only good for a few minutes, so
+    create it right before connecting."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    url: str = Field(validation_alias=AliasPath("stream", "url"))
+    session_id: str = Field(validation_alias=AliasPath("stream", "sessionid"))
@@ -0,0 +1,69 @@
+"""One row per symbol in preallocated NumPy arrays, as used by `tick_buffer` and
+`bars`. Requires the `numpy` extra.
+"""
+
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+
+
+def grow_rows(array: np.ndarray, size: int, fill: Any = 0) -> np.ndarray:
+    """`array` with its first axis extended to `size` rows, the new ones `fill`."""
+    grown = np.full((size, *array.shape[1:]), fill, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+class SymbolRows:
+    """Hands out a row per symbol, in order of first appearance, and tracks each row's
+    latest cumulative volume (-1 until known) to turn snapshots into traded sizes.
+
+    Starts with room for `capacity` rows and doubles it when full, calling `grow`
+    with the new capacity so the owner can grow its arrays to match.
+    """
+
+    def __init__(self, capacity: int, grow: Callable[[int], None]):
+        self.capacity = capacity
+        self._grow = grow
+        self._rows: dict[str, int] = {}
+        self.volume = np.full(capacity, -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def __getitem__(self, symbol: str) -> int:
+        return self._rows[symbol]
+
+    def get(self, symbol: str, default: Optional[int] = None) -> Optional[int]:
+        return self._rows.get(symbol, default)
+
+    def row(self, symbol: str) -> int:
+        """`symbol`'s row, adding it if new."""
+        if (row := self._rows.get(symbol)) is not None:
+            return row
+        row = len(self._rows)
+        if row == self.capacity:
+            self.capacity *= 2
+            self._grow(self.capacity)
+            self.volume = grow_rows(self.volume, self.capacity, -1)
+        self._rows[symbol] = row
+        return row
+
+    def rows(self, symbols: np.ndarray) -> np.ndarray:
+        """Rows of a `tradierpy.quote_columns` symbol column, adding new symbols."""
+        return np.fromiter(
+            (self.row(s) for s in symbols.tolist()), dtype=np.intp, count=len(symbols)
+        )
+
+    def traded(self, rows: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """Volume traded since each row's previous cumulative `volume` (0 the first
+        time it's seen), which then becomes the previous one. Rows must be unique."""
+        previous = self.volume[rows]
+        self.volume[rows] = volume
+        return np.where(previous >= 0, np.maximum(volume - previous, 0), 0)
@@ -0,0 +1,217 @@
+"""Per-symbol ring buffers of recent ticks in NumPy arrays. Requires the `numpy` extra.
+
+Holding on to every polled quote model for a few thousand symbols adds up quickly;
+here each tick is a handful of numbers written into preallocated arrays.
+"""
+
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from tradierpy.quote import GetQuotesResponse
+from tradierpy.quote_columns import TIMESTAMP_FIELDS, QuoteColumns, quote_columns
+from tradierpy.symbol_rows import SymbolRows, grow_rows
+
+FIELDS = {
+    # Epoch milliseconds
+    "time": np.int64,
+    "bid": np.float64,
+    "ask": np.float64,
+    "last": np.float64,
+    # Volume traded since the previous tick
+    "size": np.int64,
+    "bidsize": np.int64,
+    "asksize": np.int64,
+}
+
+
+class SpreadStats(BaseModel):
+    count: int
+    mean: float
+    min: float
+    max: float
+    std: float
+    last: float
+
+
+class TickBuffer:
+    """The last `capacity` ticks (bid, ask, last, size) per symbol.
+
+    Feed it quote snapshots with `add_response`/`add_columns`, or stream events with
+    `add_event`. For snapshots `size` is the increase in the day's volume since the
+    previous snapshot, so repeated polls don't count the same trade twice. Stream
+    events carry forward whichever of bid/ask or last they don't update.
+
+    Queries take either the last `n` ticks or the last `seconds` (relative to the
+    symbol's newest tick), or everything buffered.
+    """
+
+    def __init__(self, capacity: int = 1024, symbols: int = 64):
+        self.capacity = capacity
+        self._rows = SymbolRows(symbols, self._grow)
+        self._data = {
+            name: np.zeros((symbols, capacity), dtype=dtype)
+            for name, dtype in FIELDS.items()
+        }
+        # Ticks written per row, ever; the next slot is count % capacity
+        self._count = np.zeros(symbols, dtype=np.int64)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (*self._data.values(), self._count, self._rows.volume)
+        return sum(a.nbytes for a in arrays)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def add_response(self, response: GetQuotesResponse) -> None:
+        self.add_columns(quote_columns(response))
+
+    def add_columns(self, columns: QuoteColumns) -> None:
+        """Add one tick per quote from `tradierpy.quote_columns` columns, e.g. from
+        `TradierClient.get_quote_columns`. Symbols must be unique within a batch."""
+        rows = self._rows.rows(columns["symbol"])
+        slots = self._count[rows] % self.capacity
+        values = {
+            "time": np.maximum.reduce([columns[name] for name in TIMESTAMP_FIELDS]),
+            "bid": columns["bid"],
+            "ask": columns["ask"],
+            "last": columns["last"],
+            "size": self._rows.traded(rows, columns["volume"]),
+            "bidsize": columns["bidsize"],
+            "asksize": columns["asksize"],
+        }
+        for name, array in self._data.items():
+            array[rows, slots] = values[name]
+        self._count[rows] += 1
+
+    def add_event(self, event: Any) -> None:
+        """Add a tick from a `tradierpy.market_stream` quote or trade event; other
+        events are ignored."""
+        if event.type not in ("quote", "trade"):
+            return
+        row = self._rows.row(event.symbol)
+        count = self._count[row]
+        slot = count % self.capacity
+        data = self._data
+        if count:
+            previous = (count - 1) % self.capacity
+            bid, ask, last = (data[n][row, previous] for n in ("bid", "ask", "last"))
+            bidsize, asksize = (
+                data["bidsize"][row, previous],
+                data["asksize"][row, previous],
+            )
+        else:
+            bid = ask = last = np.nan
+            bidsize = asksize = 0
+
+        if event.type == "quote":
+            time = max(event.biddate, event.askdate)
+            bid, ask, bidsize, asksize = event.bid, event.ask, event.bidsz, event.asksz
+            size = 0
+        else:
+            time = event.date
+            last, size = event.price, event.size
+            self._rows.volume[row] = event.cvol
+
+        data["time"][row, slot] = int(time.timestamp() * 1000)
+        data["bid"][row, slot] = bid
+        data["ask"][row, slot] = ask
+        data["last"][row, slot] = last
+        data["size"][row, slot] = size
+        data["bidsize"][row, slot] = bidsize
+        data["asksize"][row, slot] = asksize
+        self._count[row] = count + 1
+
+    def add_events(self, events: Iterable[Any]) -> None:
+        for event in events:
+            self.add_event(event)
+
+    def ticks(
+        self, symbol: str, n: Optional[int] = None, seconds: Optional[float] = None
+    ) -> dict[str, np.ndarray]:
+        """Buffered ticks for `symbol`, oldest first, as one array per field."""
+        row, slots = self._slots(symbol, n, seconds)
+        return {name: array[row, slots] for name, array in self._data.items()}
+
+    def mids(
+        self, symbol: str, n: Optional[int] = None, seconds: Optional[float] = None
+    ) -> np.ndarray:
+        row, slots = self._slots(symbol, n, seconds)
+        return (self._data["bid"][row, slots] + self._data["ask"][row, slots]) / 2
+
+    def spreads(
+        self, symbol: str, n: Optional[int] = None, seconds: Optional[float] = None
+    ) -> np.ndarray:
+        row, slots = self._slots(symbol, n, seconds)
+        return self._data["ask"][row, slots] - self._data["bid"][row, slots]
+
+    def vwap(
+        self, symbol: str, n: Optional[int] = None, seconds: Optional[float] = None
+    ) -> float:
+        """Volume weighted average of `last`; NaN without any volume."""
+        row, slots = self._slots(symbol, n, seconds)
+        size = self._data["size"][row, slots]
+        volume = size.sum()
+        if not volume:
+            return np.nan
+        return float(np.dot(self._data["last"][row, slots], size) / volume)
+
+    def spread_stats(
+        self, symbol: str, n: Optional[int] = None, seconds: Optional[float] = None
+    ) -> SpreadStats:
+        spreads = self.spreads(symbol, n, seconds)
+        spreads = spreads[~np.isnan(spreads)]
+        if not len(spreads):
+            return SpreadStats(
+                count=0, mean=np.nan, min=np.nan, max=np.nan, std=np.nan, last=np.nan
+            )
+        return SpreadStats(
+            count=len(spreads),
+            mean=spreads.mean(),
+            min=spreads.min(),
+            max=spreads.max(),
+            std=spreads.std(),
+            last=spreads[-1],
+        )
+
+    def latest_mids(self, symbols: Optional[Iterable[str]] = None) -> np.ndarray:
+        """The newest mid for each of `symbols` (default: all, in `symbols` order),
+        NaN for symbols without ticks."""
+        symbols = self.symbols if symbols is None else list(symbols)
+        rows = np.array([self._rows.get(s, -1) for s in symbols], dtype=np.intp)
+        known = rows >= 0
+        rows = rows[known]
+        # Rows only exist once a tick has been added
+        slots = (self._count[rows] - 1) % self.capacity
+        mids = np.full(len(known), np.nan)
+        mids[known] = (
+            self._data["bid"][rows, slots] + self._data["ask"][rows, slots]
+        ) / 2
+        return mids
+
+    def _grow(self, size: int) -> None:
+        for name, array in self._data.items():
+            self._data[name] = grow_rows(array, size)
+        self._count = grow_rows(self._count, size)
+
+    def _slots(
+        self, symbol: str, n: Optional[int], seconds: Optional[float]
+    ) -> tuple[int, np.ndarray]:
+        row = self._rows[symbol]
+        count = int(self._count[row])
+        buffered = min(count, self.capacity)
+        n = buffered if n is None else min(n, buffered)
+        slots = (count - n + np.arange(n)) % self.capacity
+        if seconds is not None and n:
+            times = self._data["time"][row, slots]
+            slots = slots[times >= times[-1] - seconds * 1000]
+        return row, slots